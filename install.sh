@@ -344,6 +344,9 @@ echo "Installing TuxBox driver..."
 ./venv/bin/pip install -q --upgrade pip
 ./venv/bin/pip install -q -e .
 
+# Pre-parse the built-in profiles (written to ~/.cache/tuxbox/default_mappings.pkl)
+./venv/bin/python -c "from tuxbox.config_loader import load_default_profiles; load_default_profiles()" >/dev/null 2>&1 || true
+
 echo -e "${GREEN}✓${NC} Driver installed successfully"
 
 # Install GUI dependencies
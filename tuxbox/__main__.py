@@ -5,7 +5,8 @@ Automatically detects whether the TourBox is connected via USB or Bluetooth
 and launches the appropriate driver.
 
 Priority:
-1. USB (scans /dev/ttyACM* devices, probes each for TourBox response)
+1. USB (finds TourBox ports by USB ID via udev when pyudev is installed,
+   otherwise scans /dev/ttyACM* devices and probes each for TourBox response)
 2. BLE (fallback)
 
 Can be overridden with --usb or --ble flags.
@@ -13,23 +14,69 @@ Can be overridden with --usb or --ble flags.
 
 import sys
 import os
-import asyncio
 import argparse
 import logging
-import glob
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from .config_loader import load_device_config
 
+if TYPE_CHECKING:
+    import serial
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_USB_PORT = "/dev/ttyACM0"
 
 # Unlock command used to probe for TourBox
-UNLOCK_COMMAND = bytes.fromhex("5500078894001afe")
+UNLOCK_COMMAND = b"\x55\x00\x07\x88\x94\x00\x1a\xfe"
+
+# TourBox USB IDs (same as device_usb, which needs pyserial to import)
+USB_VID = 0x0483  # STMicroelectronics
+USB_PID_ELITE = 0x5741  # Confirmed Elite
+USB_PID_AMBIGUOUS = 0x5740  # Neo, early Elite firmware, or any STM32 virtual COM port
+
+
+def find_udev_usb_ports() -> Optional[Tuple[List[str], List[str]]]:
+    """List serial ports with TourBox USB IDs using udev
+
+    Requires the optional pyudev package.
+
+    Returns:
+        Tuple of (confirmed, unconfirmed) port lists. Confirmed ports have the
+        Elite product ID and need no probing; unconfirmed ports use the
+        generic STM32 product ID and must still be probed. None if pyudev is
+        not installed or no ports with the TourBox vendor ID were found.
+    """
+    try:
+        import pyudev
+    except ImportError:
+        return None
+
+    confirmed = []
+    unconfirmed = []
+    try:
+        context = pyudev.Context()
+        for device in context.list_devices(subsystem='tty', ID_VENDOR_ID=f'{USB_VID:04x}'):
+            model_id = device.get('ID_MODEL_ID', '')
+            if not device.device_node:
+                continue
+            if model_id == f'{USB_PID_ELITE:04x}':
+                confirmed.append(device.device_node)
+            elif model_id == f'{USB_PID_AMBIGUOUS:04x}':
+                unconfirmed.append(device.device_node)
+    except Exception as e:
+        logger.debug(f"udev enumeration failed: {e}")
+        return None
 
+    if not confirmed and not unconfirmed:
+        return None
 
-def probe_usb_device(port: str) -> bool:
+    return sorted(confirmed), sorted(unconfirmed)
+
+
+def probe_usb_device(port: str) -> Optional['serial.Serial']:
     """Probe a USB serial port to check if it's a TourBox Elite
 
     Sends the unlock command and checks for a valid response.
@@ -38,88 +85,148 @@ def probe_usb_device(port: str) -> bool:
         port: Serial port path to check
 
     Returns:
-        True if the device responds like a TourBox, False otherwise
+        The open serial port if the device responds like a TourBox (the
+        caller takes ownership and hands it to the USB driver), None otherwise
     """
     try:
         import serial
     except ImportError:
         logger.warning("pyserial not installed, cannot probe USB devices")
-        return os.path.exists(port)  # Fall back to simple existence check
+        return None
 
+    ser = None
     try:
         logger.debug(f"Probing {port} for TourBox...")
 
-        # Try to open the port
-        ser = serial.Serial(port, baudrate=115200, timeout=0.5)
+        # Try to open the port (short timeout - reads are polled below)
+        ser = serial.Serial(port, baudrate=115200, timeout=0.05)
         ser.reset_input_buffer()
 
         # Send unlock command
         ser.write(UNLOCK_COMMAND)
         ser.flush()
 
-        # Wait for response
-        time.sleep(0.3)
-
         # Read response - TourBox should respond with ~26 bytes
-        response = ser.read(100)
-        ser.close()
+        # Stop as soon as enough bytes arrived or the device goes quiet,
+        # rather than sleeping for a fixed delay. The overall deadline keeps
+        # the old worst case (0.3s delay + 0.5s read timeout).
+        response = bytearray()
+        deadline = time.monotonic() + 0.8
+        while time.monotonic() < deadline:
+            chunk = ser.read(100)
+            if chunk:
+                response += chunk
+                if len(response) >= 20:
+                    break
+            elif response:
+                break
 
         if response:
-            logger.debug(f"  Response from {port}: {response.hex()[:40]}...")
+            logger.debug(f"  Response from {port}: {response[:20].hex()}...")
             # TourBox unlock response is typically 26 bytes
             # Different firmware versions may have different first bytes (0x07, 0x7a, etc.)
             # Accept any response of reasonable length as a valid TourBox
             if len(response) >= 20:
                 logger.info(f"  Found TourBox at {port} ({len(response)} bytes)")
-                return True
+                return ser
             else:
                 logger.debug(f"  {port} responded but too short ({len(response)} bytes)")
         else:
             logger.debug(f"  No response from {port}")
 
-        return False
+        ser.close()
+        return None
 
     except serial.SerialException as e:
         logger.debug(f"  Cannot open {port}: {e}")
-        return False
     except Exception as e:
         logger.debug(f"  Error probing {port}: {e}")
-        return False
 
+    if ser is not None:
+        ser.close()
+    return None
+
+
+def list_acm_devices() -> List[str]:
+    """List /dev/ttyACM* device nodes
+
+    Uses a single directory scan instead of globbing and stat'ing each path.
 
-def find_tuxbox_usb_port(configured_port: str = None) -> str:
+    Returns:
+        Sorted list of device paths
+    """
+    try:
+        with os.scandir('/dev') as entries:
+            return sorted(entry.path for entry in entries if entry.name.startswith('ttyACM'))
+    except OSError:
+        return []
+
+
+def find_tuxbox_usb_port(configured_port: str = None) -> Tuple[Optional[str], Optional['serial.Serial']]:
     """Find the TourBox Elite USB port by scanning available devices
 
     Args:
         configured_port: User-configured port to try first
 
     Returns:
-        Port path if found, None otherwise
+        Tuple of (port path, open serial port from the probe). The serial
+        port is None when the port was identified without probing; both are
+        None if no TourBox was found.
     """
-    # If a specific port is configured, try it first
-    if configured_port and os.path.exists(configured_port):
-        logger.debug(f"Trying configured port: {configured_port}")
-        if probe_usb_device(configured_port):
-            return configured_port
+    # Let udev identify the device by USB ID - an Elite product ID needs no
+    # probe, and unrelated ACM devices (Arduinos, modems) are never opened
+    udev_ports = find_udev_usb_ports()
+    if udev_ports:
+        confirmed, unconfirmed = udev_ports
+        if confirmed:
+            port = configured_port if configured_port in confirmed else confirmed[0]
+            logger.info(f"  Found TourBox at {port} (USB ID {USB_VID:04x}:{USB_PID_ELITE:04x})")
+            return port, None
+
+    if udev_ports:
+        # Only the ports with the generic STM32 product ID need probing
+        acm_devices = udev_ports[1]
+    else:
+        # Scan all ttyACM devices
+        acm_devices = list_acm_devices()
 
-    # Scan all ttyACM devices
-    acm_devices = sorted(glob.glob("/dev/ttyACM*"))
+    # If a specific port is configured, try it first (the scan above already
+    # saw it if it is a ttyACM node, otherwise check that it exists)
+    if configured_port and (configured_port in acm_devices or os.path.exists(configured_port)):
+        logger.debug(f"Trying configured port: {configured_port}")
+        handle = probe_usb_device(configured_port)
+        if handle:
+            return configured_port, handle
 
-    if not acm_devices:
+    if udev_ports:
+        logger.debug(f"Found {len(acm_devices)} candidate port(s) via udev: {acm_devices}")
+    elif not acm_devices:
         logger.debug("No /dev/ttyACM* devices found")
-        return None
-
-    logger.debug(f"Found {len(acm_devices)} ACM device(s): {acm_devices}")
-
-    for port in acm_devices:
-        # Skip if we already tried the configured port
-        if port == configured_port:
+        return None, None
+    else:
+        logger.debug(f"Found {len(acm_devices)} ACM device(s): {acm_devices}")
+
+    # Skip the configured port if we already tried it
+    candidates = [port for port in acm_devices if port != configured_port]
+    if not candidates:
+        return None, None
+
+    # Probing is almost entirely waiting on the device, so probe all ports
+    # concurrently. Results come back in port order, so the first match is
+    # the same one a sequential scan would pick.
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        results = list(executor.map(probe_usb_device, candidates))
+
+    found = None
+    for port, handle in zip(candidates, results):
+        if handle is None:
             continue
+        if found is None:
+            found = (port, handle)
+        else:
+            handle.close()  # Another TourBox - only the first one is used
 
-        if probe_usb_device(port):
-            return port
-
-    return None
+    return found or (None, None)
 
 
 def main():
@@ -164,16 +271,31 @@ def main():
         print("Error: Cannot specify both --usb and --ble")
         sys.exit(1)
 
+    # Serial port left open by a successful probe, reused by the USB driver
+    usb_serial = None
+
+    # Each path below scans for the USB device at most once
     if args.usb:
         mode = 'usb'
         logger.info("USB mode forced via --usb flag")
+
+        # Scan for the device unless a port was given explicitly
+        if not args.port:
+            detected_port, usb_serial = find_tuxbox_usb_port(usb_port)
+            if detected_port:
+                usb_port = detected_port
+            elif not os.path.exists(usb_port):
+                print(f"Error: No TourBox found on USB")
+                print("Is the TourBox connected via USB cable?")
+                print(f"Checked: /dev/ttyACM* devices")
+                sys.exit(1)
     elif args.ble:
         mode = 'ble'
         logger.info("BLE mode forced via --ble flag")
     else:
         # Auto-detect: scan for TourBox USB device
         print("Scanning for TourBox...")
-        detected_port = find_tuxbox_usb_port(usb_port)
+        detected_port, usb_serial = find_tuxbox_usb_port(usb_port)
         if detected_port:
             mode = 'usb'
             usb_port = detected_port
@@ -188,23 +310,12 @@ def main():
     if mode == 'usb':
         from .device_usb import TuxBoxUSB
 
-        # If USB mode was forced, scan for the device
-        if args.usb and not args.port:
-            detected_port = find_tuxbox_usb_port(usb_port)
-            if detected_port:
-                usb_port = detected_port
-            elif not os.path.exists(usb_port):
-                print(f"Error: No TourBox found on USB")
-                print("Is the TourBox connected via USB cable?")
-                print(f"Checked: /dev/ttyACM* devices")
-                sys.exit(1)
-
         if not os.path.exists(usb_port):
             print(f"Error: USB port {usb_port} not found")
             print("Is the TourBox connected via USB?")
             sys.exit(1)
 
-        driver = TuxBoxUSB(port=usb_port, config_path=args.config)
+        driver = TuxBoxUSB(port=usb_port, config_path=args.config, serial_handle=usb_serial)
 
     else:  # BLE mode
         from .device_ble import TuxBoxBLE
@@ -212,8 +323,10 @@ def main():
         driver = TuxBoxBLE(config_path=args.config)
 
     # Run the driver
+    from .device_base import run_event_loop
+
     try:
-        asyncio.run(driver.start())
+        run_event_loop(driver.start())
     except KeyboardInterrupt:
         print("\nExited by user")
     except Exception as e:
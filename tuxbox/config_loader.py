@@ -8,18 +8,54 @@ Supports application-specific profiles for automatic mapping switching.
 """
 
 import os
+import sys
 import configparser
+import functools
 import logging
-import re
+import pickle
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from evdev import ecodes as e
 
+from . import VERSION
 from .haptic import HapticConfig, HapticStrength, HapticSpeed
 
 logger = logging.getLogger(__name__)
 
 
+# Profile fields matched against the active window (see Profile.__setattr__)
+_MATCHER_FIELDS = frozenset({'app_id', 'window_class', 'window_title'})
+
+
+# Window matchers specialized on which Profile matchers are set, so a
+# profile only runs the checks it actually has (see Profile._select_matcher)
+def _match_nothing(profile, window_info) -> bool:
+    return False
+
+
+def _match_app_id(profile, window_info) -> bool:
+    return window_info.app_id_lc == profile._app_id_lc
+
+
+def _match_window_class(profile, window_info) -> bool:
+    return window_info.wm_class_lc == profile._window_class_lc
+
+
+def _match_window_title(profile, window_info) -> bool:
+    return profile._window_title_lc in window_info.title_lc
+
+
+def _match_any(profile, window_info) -> bool:
+    # Cheapest and most selective first: app_id, then class, then title substring
+    if profile._app_id_lc and window_info.app_id_lc == profile._app_id_lc:
+        return True
+    if profile._window_class_lc and window_info.wm_class_lc == profile._window_class_lc:
+        return True
+    if profile._window_title_lc and profile._window_title_lc in window_info.title_lc:
+        return True
+    return False
+
+
 @dataclass
 class Profile:
     """Application-specific button mapping profile"""
@@ -58,6 +94,29 @@ class Profile:
     # Per-profile modifier delay override (None = use global, 0 = disabled, >0 = ms)
     modifier_delay: Optional[int] = None
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Keep the lowercased matcher copies in step - the GUI edits matchers in place
+        if name in _MATCHER_FIELDS:
+            super().__setattr__(f"_{name}_lc", value.lower() if value else None)
+            super().__setattr__('_match_fn', self._select_matcher())
+
+    def _select_matcher(self):
+        """Pick the window matcher for the currently configured matchers"""
+        configured = [
+            (attr, fn) for attr, fn in (
+                ('_app_id_lc', _match_app_id),
+                ('_window_class_lc', _match_window_class),
+                ('_window_title_lc', _match_window_title),
+            )
+            if getattr(self, attr, None)
+        ]
+        if not configured:
+            return _match_nothing
+        if len(configured) == 1:
+            return configured[0][1]
+        return _match_any
+
     def matches(self, window_info) -> bool:
         """Check if this profile matches the given window info"""
         # Disabled profiles never match (except default which is always enabled)
@@ -67,22 +126,9 @@ class Profile:
         if not window_info:
             return False
 
-        # Check app_id match (exact or case-insensitive)
-        if self.app_id:
-            if window_info.app_id and window_info.app_id.lower() == self.app_id.lower():
-                return True
-
-        # Check window_class match (exact or case-insensitive)
-        if self.window_class:
-            if window_info.wm_class and window_info.wm_class.lower() == self.window_class.lower():
-                return True
-
-        # Check window_title match (substring, case-insensitive)
-        if self.window_title:
-            if window_info.title and self.window_title.lower() in window_info.title.lower():
-                return True
-
-        return False
+        # app_id and window_class match exactly, window_title as a substring,
+        # all case-insensitive
+        return self._match_fn(self, window_info)
 
     def __repr__(self):
         matchers = []
@@ -121,8 +167,43 @@ BUTTON_CODES = {
     'dial_ccw': (0x0f, 0x8f),
 }
 
+# BUTTON_CODES as the single-byte keys used in Profile.mapping
+_BUTTON_BYTES = {name: tuple(bytes([code]) for code in codes) for name, codes in BUTTON_CODES.items()}
+
 # Supported key names (subset of evdev ecodes)
-KEY_NAMES = {
+class _KeyNames(dict):
+    """Key name -> evdev code mapping that resolves generated names on demand
+
+    Letter, number and function keys are looked up on the ecodes module the
+    first time they are used and then cached, instead of being materialized
+    at import. Only names in _LAZY_KEY_NAMES are resolved this way, so `in`
+    is only reliable for the hand-listed entries; use indexing or .get().
+    """
+
+    def __missing__(self, key):
+        if key not in _LAZY_KEY_NAMES:
+            raise KeyError(key)
+        value = getattr(e, key)
+        self[key] = value
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+_LAZY_KEY_NAMES = frozenset(
+    # Letter keys
+    [f'KEY_{chr(i)}' for i in range(ord('A'), ord('Z') + 1)]
+    # Number keys
+    + [f'KEY_{i}' for i in range(0, 10)]
+    # Function keys (F1-F12, includes extended function keys for meta-configuration)
+    + [f'KEY_F{i}' for i in range(1, 13)]
+)
+
+KEY_NAMES = _KeyNames({
     'KEY_LEFTMETA': e.KEY_LEFTMETA,
     'KEY_LEFTCTRL': e.KEY_LEFTCTRL,
     'KEY_LEFTSHIFT': e.KEY_LEFTSHIFT,
@@ -170,17 +251,11 @@ KEY_NAMES = {
     'KEY_STOPCD': e.KEY_STOPCD,
     'KEY_PREVIOUSSONG': e.KEY_PREVIOUSSONG,
     'KEY_NEXTSONG': e.KEY_NEXTSONG,
-    # Letter keys
-    **{f'KEY_{chr(i)}': getattr(e, f'KEY_{chr(i)}') for i in range(ord('A'), ord('Z') + 1)},
-    # Number keys
-    **{f'KEY_{i}': getattr(e, f'KEY_{i}') for i in range(0, 10)},
-    # Function keys (F1-F12, includes extended function keys for meta-configuration)
-    **{f'KEY_F{i}': getattr(e, f'KEY_F{i}') for i in range(1, 13)},
     # Mouse buttons
     'BTN_LEFT': e.BTN_LEFT,
     'BTN_RIGHT': e.BTN_RIGHT,
     'BTN_MIDDLE': e.BTN_MIDDLE,
-}
+})
 
 # Mouse/relative movement
 REL_NAMES = {
@@ -190,6 +265,44 @@ REL_NAMES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _ecode_names(prefixes: Tuple[str, ...]) -> Dict[int, str]:
+    """Build an evdev code -> name table for names with the given prefixes
+
+    Built on first use. Where several names share a code the first one in
+    the ecodes module wins, as with a linear scan of it.
+    """
+    names = {}
+    for name, code in vars(e).items():
+        if name.startswith(prefixes) and isinstance(code, int):
+            names.setdefault(code, name)
+    return names
+
+
+def key_code_name(code: int) -> Optional[str]:
+    """Get the KEY_ or BTN_ name of an evdev key code
+
+    Args:
+        code: evdev key code
+
+    Returns:
+        Name like 'KEY_LEFTCTRL' or 'BTN_LEFT', or None if unknown
+    """
+    return _ecode_names(('KEY_', 'BTN_')).get(code)
+
+
+def rel_code_name(code: int) -> Optional[str]:
+    """Get the REL_ name of an evdev relative axis code
+
+    Args:
+        code: evdev relative axis code
+
+    Returns:
+        Name like 'REL_WHEEL', or None if unknown
+    """
+    return _ecode_names(('REL_',)).get(code)
+
+
 def parse_action(action_str: str) -> List[Tuple[int, int, int]]:
     """Parse an action string into evdev events
 
@@ -203,37 +316,49 @@ def parse_action(action_str: str) -> List[Tuple[int, int, int]]:
     Returns:
         List of (event_type, event_code, value) tuples
     """
-    events = []
+    return list(_parse_action_cached(action_str))
+
 
+@functools.lru_cache(maxsize=1024)
+def _parse_action_cached(action_str: str) -> Tuple[Tuple[int, int, int], ...]:
+    """Parse an action string (see parse_action), memoized
+
+    The same action strings recur across buttons, combos and profiles, so
+    each distinct string is parsed once. Returns a tuple so the cached
+    value cannot be mutated by callers; warnings for unknown names are
+    logged on the first parse only.
+    """
     if not action_str or action_str == 'none':
-        return events
+        return ()
+
+    events = []
+    # Local aliases for the lookups done per part
+    rel_names, key_names = REL_NAMES, KEY_NAMES
+    ev_rel, ev_key = e.EV_REL, e.EV_KEY
 
     # Split by + first to handle compound actions like KEY_LEFTCTRL+REL_WHEEL:1
-    parts = [p.strip() for p in action_str.split('+')]
-
-    for part in parts:
-        # Check if this part is a relative event (has : and matches REL_*)
-        if ':' in part:
-            rel_parts = part.split(':')
-            if len(rel_parts) == 2:
-                rel_name, value_str = rel_parts
-                rel_name = rel_name.strip()
-                if rel_name in REL_NAMES:
-                    try:
-                        value = int(value_str.strip())
-                        events.append((e.EV_REL, REL_NAMES[rel_name], value))
-                        continue
-                    except ValueError:
-                        logger.error(f"Invalid relative value: {value_str}")
-                        continue
+    for part in action_str.split('+'):
+        part = part.strip()
+
+        # Check if this part is a relative event ("REL_*:value", exactly one colon)
+        rel_name, sep, value_str = part.partition(':')
+        if sep and ':' not in value_str:
+            rel_code = rel_names.get(rel_name.strip())
+            if rel_code is not None:
+                try:
+                    events.append((ev_rel, rel_code, int(value_str.strip())))
+                except ValueError:
+                    logger.error(f"Invalid relative value: {value_str}")
+                continue
 
         # Check if this part is a key (includes BTN_LEFT/RIGHT/MIDDLE)
-        if part in KEY_NAMES:
-            events.append((e.EV_KEY, KEY_NAMES[part], 1))  # Press
+        key_code = key_names.get(part)
+        if key_code is not None:
+            events.append((ev_key, key_code, 1))  # Press
         else:
             logger.warning(f"Unknown key/button name: {part}")
 
-    return events
+    return tuple(events)
 
 
 def create_button_mapping(press_action: str, release_action: str = None) -> Tuple[List, List]:
@@ -275,12 +400,31 @@ def get_config_path(config_path: str = None) -> str:
     if config_path is not None and os.path.exists(config_path):
         return config_path
 
-    # Default config locations
+    # The candidate list only depends on the environment; existence is still
+    # checked on every call since configs get created or migrated at runtime
+    default_paths = _default_config_paths(os.environ.get('SUDO_USER'), os.environ.get('HOME'))
+
+    for path in default_paths:
+        if os.path.exists(path):
+            return path
+
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def _default_config_paths(sudo_user: Optional[str], home: Optional[str]) -> Tuple[str, ...]:
+    """Build the default config locations, in search order
+
+    Cached since resolving ~user reads the password database. The arguments
+    are the SUDO_USER and HOME environment values, which the paths depend on.
+
+    Returns:
+        Tuple of candidate config file paths
+    """
     default_paths = []
 
     # If running under sudo, check the real user's config first
     # This allows: sudo ./driver -> uses /home/username/.config/tuxbox/...
-    sudo_user = os.environ.get('SUDO_USER')
     if sudo_user:
         sudo_home = os.path.expanduser(f'~{sudo_user}')
         # Check new format first
@@ -300,14 +444,104 @@ def get_config_path(config_path: str = None) -> str:
         os.path.expanduser('~/.config/tourbox/config.conf'),  # Pre-v3 legacy path
         os.path.expanduser('~/.config/tourbox/mappings.conf'),  # Pre-v3 legacy path
         '/etc/tuxbox/mappings.conf',  # System-wide config
-        os.path.join(os.path.dirname(__file__), 'default_mappings.conf'),  # Built-in fallback
+        DEFAULT_MAPPINGS_PATH,  # Built-in fallback
     ])
 
-    for path in default_paths:
-        if os.path.exists(path):
-            return path
+    return tuple(default_paths)
 
-    return None
+
+# Parsed config files by path, with the (mtime_ns, size) they were read at
+# (see read_config_sections)
+_config_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, str]]]] = {}
+
+
+def read_config_sections(config_path: str) -> Dict[str, Dict[str, str]]:
+    """Read an INI config file into a section -> options dictionary
+
+    The files written by TuxBox only use plain "[section]" headers,
+    "key = value" lines and "#" comments, which are tokenized here in a
+    single pass. Anything else (continuation lines, duplicates, a DEFAULT
+    section, malformed lines) falls back to configparser, so the result and
+    any parse errors are the same as with the settings used before.
+
+    The device settings and legacy profiles are often read from the same
+    file, so the result is cached per path and reused while the file's
+    mtime and size are unchanged. Callers must not modify it.
+
+    Args:
+        config_path: Path to the config file (a missing file reads as empty)
+
+    Returns:
+        Dict mapping section name -> {option (lowercased): value}
+    """
+    try:
+        with open(config_path) as f:
+            st = os.fstat(f.fileno())
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _config_cache.get(config_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            text = f.read()
+    except OSError:
+        return {}
+
+    sections = _tokenize_plain_ini(text)
+    if sections is None:
+        config = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
+        config.read_string(text, source=config_path)
+        sections = {section: dict(config[section]) for section in config.sections()}
+
+    _config_cache[config_path] = (stamp, sections)
+    return sections
+
+
+def _tokenize_plain_ini(text: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Tokenize the plain INI subset (see read_config_sections)
+
+    Returns:
+        Section dictionary, or None if the text needs a full configparser read
+    """
+    sections = {}
+    current = None
+
+    for line in text.split('\n'):
+        stripped = line.strip()
+
+        # Blank and full-line comments
+        if not stripped or stripped[0] in '#;':
+            continue
+
+        # Indented lines may be value continuations
+        if line[0].isspace():
+            return None
+
+        # Inline comments start at a '#' preceded by whitespace
+        hash_pos = line.find('#')
+        while hash_pos > 0 and not line[hash_pos - 1].isspace():
+            hash_pos = line.find('#', hash_pos + 1)
+        if hash_pos > 0:
+            stripped = line[:hash_pos].strip()
+
+        if stripped[0] == '[':
+            name = stripped[1:-1]
+            if stripped[-1] != ']' or not name or name in sections or name == 'DEFAULT':
+                return None
+            current = sections[name] = {}
+            continue
+
+        # "key = value" or "key: value", split at whichever delimiter comes first
+        eq_pos, colon_pos = stripped.find('='), stripped.find(':')
+        if colon_pos != -1 and (eq_pos == -1 or colon_pos < eq_pos):
+            eq_pos = colon_pos
+        if current is None or eq_pos <= 0:
+            return None
+
+        key = stripped[:eq_pos].rstrip().lower()
+        if not key or key in current:
+            return None
+        current[key] = stripped[eq_pos + 1:].strip()
+
+    return sections
 
 
 def load_device_config(config_path: str = None) -> Dict[str, str]:
@@ -327,8 +561,7 @@ def load_device_config(config_path: str = None) -> Dict[str, str]:
 
     logger.info(f"Loading device config from {config_path}")
 
-    config = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
-    config.read(config_path)
+    config = read_config_sections(config_path)
 
     device_config = {}
 
@@ -353,15 +586,16 @@ def load_device_config(config_path: str = None) -> Dict[str, str]:
     return device_config
 
 
-def parse_profile_mappings(config: configparser.ConfigParser, section_name: str) -> Tuple[Dict, Dict]:
+def parse_profile_mappings(config: Dict[str, Dict[str, str]], section_name: str) -> Tuple[Dict, Dict]:
     """Parse button/rotary mappings from a profile section
 
     Args:
-        config: ConfigParser instance
+        config: Config sections (see read_config_sections)
         section_name: Name of the section (e.g., 'profile:vscode')
 
     Returns:
-        Tuple of (mapping_dict, capabilities_dict)
+        Tuple of (mapping_dict, capabilities_dict) - capabilities are sets of
+        event codes per type, to be converted to lists once fully merged
     """
     mapping = {}
 
@@ -377,10 +611,10 @@ def parse_profile_mappings(config: configparser.ConfigParser, section_name: str)
 
         # Check if it's a button
         if key in BUTTON_CODES:
-            codes = BUTTON_CODES[key]
+            codes = _BUTTON_BYTES[key]
 
             # Check if it's a rotary control (knob, scroll, dial)
-            is_rotary = key in ('scroll_up', 'scroll_down', 'knob_cw', 'knob_ccw', 'dial_cw', 'dial_ccw')
+            is_rotary = key in INVALID_MODIFIER_CONTROLS
 
             if len(codes) == 2:
                 press_code, release_code = codes
@@ -389,19 +623,19 @@ def parse_profile_mappings(config: configparser.ConfigParser, section_name: str)
                 if is_rotary:
                     # For rotary: rotation event = full press+release cycle
                     # Stop event = release only (to ensure keys don't stick)
-                    mapping[bytes([press_code])] = press_events + release_events
-                    mapping[bytes([release_code])] = release_events
+                    mapping[press_code] = press_events + release_events
+                    mapping[release_code] = release_events
                 else:
                     # For buttons: separate press and release
-                    mapping[bytes([press_code])] = press_events
-                    mapping[bytes([release_code])] = release_events
+                    mapping[press_code] = press_events
+                    mapping[release_code] = release_events
             elif len(codes) == 1:  # Old format rotary event
                 code = codes[0]
                 events = parse_action(action)
-                mapping[bytes([code])] = events
+                mapping[code] = events
 
     # Get capabilities for UInput
-    caps = get_capabilities_from_mapping(mapping)
+    caps = _capability_sets(mapping)
 
     return mapping, caps
 
@@ -432,9 +666,33 @@ def load_profiles(config_path: str = None) -> List[Profile]:
         logger.warning("No config file found for profiles")
         return []
 
+    if config_path == DEFAULT_MAPPINGS_PATH:
+        return load_default_profiles()
+
     return load_profiles_from_legacy_file(config_path)
 
 
+# Legacy config section prefix, e.g. [profile:default]
+_PROFILE_SECTION_PREFIX = 'profile:'
+
+# Built-in profiles shipped with the package (legacy format)
+DEFAULT_MAPPINGS_PATH = os.path.join(os.path.dirname(__file__), 'default_mappings.conf')
+
+# Bump when the pickled Profile layout changes (see load_default_profiles)
+_DEFAULT_PICKLE_FORMAT = 1
+
+# Modules defining the classes stored in the pickle. Their mtime and size are
+# part of the stamp so an editable install notices code edits without a
+# version bump.
+_DEFAULT_PICKLE_MODULES = (__file__, sys.modules[HapticConfig.__module__].__file__)
+
+
+def _get_cache_dir() -> str:
+    """Get the per-user cache directory (XDG_CACHE_HOME, default ~/.cache)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'tuxbox')
+
+
 def load_profiles_from_legacy_file(config_path: str) -> List[Profile]:
     """Load profiles from a legacy format config file
 
@@ -449,17 +707,14 @@ def load_profiles_from_legacy_file(config_path: str) -> List[Profile]:
     """
     logger.info(f"Loading profiles from {config_path} (legacy format)")
 
-    config = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
-    config.read(config_path)
+    config = read_config_sections(config_path)
 
     profiles = []
 
     # Find all profile sections
-    profile_pattern = re.compile(r'^profile:(.+)$')
-    for section in config.sections():
-        match = profile_pattern.match(section)
-        if match:
-            profile_name = match.group(1)
+    for section in config:
+        if section.startswith(_PROFILE_SECTION_PREFIX) and len(section) > len(_PROFILE_SECTION_PREFIX):
+            profile_name = section[len(_PROFILE_SECTION_PREFIX):]
 
             # Parse matchers
             window_class = config[section].get('window_class')
@@ -470,7 +725,8 @@ def load_profiles_from_legacy_file(config_path: str) -> List[Profile]:
             mapping, caps = parse_profile_mappings(config, section)
 
             # Parse modifier configurations
-            modifier_buttons, modifier_mappings, modifier_base_actions = parse_modifier_mappings(config, section)
+            modifier_buttons, modifier_mappings, modifier_base_actions, modifier_events = \
+                parse_modifier_mappings(config, section)
 
             # Parse comments
             mapping_comments, modifier_combo_comments = parse_mapping_comments(config, section)
@@ -478,35 +734,8 @@ def load_profiles_from_legacy_file(config_path: str) -> List[Profile]:
             # Parse haptic configuration
             haptic_config = parse_haptic_config(config, section)
 
-            # Add modifier combo actions to capabilities
-            for action_str in modifier_mappings.values():
-                events = parse_action(action_str)
-                for event_type, event_code, value in events:
-                    if event_type == e.EV_KEY:
-                        if e.EV_KEY not in caps:
-                            caps[e.EV_KEY] = []
-                        if event_code not in caps[e.EV_KEY]:
-                            caps[e.EV_KEY].append(event_code)
-                    elif event_type == e.EV_REL:
-                        if e.EV_REL not in caps:
-                            caps[e.EV_REL] = []
-                        if event_code not in caps[e.EV_REL]:
-                            caps[e.EV_REL].append(event_code)
-
-            # Add modifier base actions to capabilities
-            for action_str in modifier_base_actions.values():
-                events = parse_action(action_str)
-                for event_type, event_code, value in events:
-                    if event_type == e.EV_KEY:
-                        if e.EV_KEY not in caps:
-                            caps[e.EV_KEY] = []
-                        if event_code not in caps[e.EV_KEY]:
-                            caps[e.EV_KEY].append(event_code)
-                    elif event_type == e.EV_REL:
-                        if e.EV_REL not in caps:
-                            caps[e.EV_REL] = []
-                        if event_code not in caps[e.EV_REL]:
-                            caps[e.EV_REL].append(event_code)
+            # Add modifier combo actions and base actions to capabilities
+            _merge_caps(caps, modifier_events)
 
             profile = Profile(
                 name=profile_name,
@@ -514,7 +743,7 @@ def load_profiles_from_legacy_file(config_path: str) -> List[Profile]:
                 window_title=window_title,
                 app_id=app_id,
                 mapping=mapping,
-                capabilities=caps,
+                capabilities={event_type: list(codes) for event_type, codes in caps.items()},
                 modifier_buttons=modifier_buttons,
                 modifier_mappings=modifier_mappings,
                 modifier_base_actions=modifier_base_actions,
@@ -524,32 +753,96 @@ def load_profiles_from_legacy_file(config_path: str) -> List[Profile]:
             )
 
             profiles.append(profile)
-            logger.info(f"Loaded profile: {profile}")
-            if modifier_buttons:
-                logger.info(f"  Modifiers: {', '.join(modifier_buttons)}")
-            if modifier_mappings:
-                logger.info(f"  Modifier combos: {len(modifier_mappings)}")
-            if haptic_config.global_setting is not None:
-                speed_str = f", speed={haptic_config.global_speed}" if haptic_config.global_speed else ""
-                logger.info(f"  Haptic: {haptic_config.global_setting}{speed_str}")
+
+            # One log record per profile, only formatted when INFO is enabled
+            if logger.isEnabledFor(logging.INFO):
+                lines = [f"Loaded profile: {profile}"]
+                if modifier_buttons:
+                    lines.append(f"  Modifiers: {', '.join(modifier_buttons)}")
+                if modifier_mappings:
+                    lines.append(f"  Modifier combos: {len(modifier_mappings)}")
+                if haptic_config.global_setting is not None:
+                    speed_str = f", speed={haptic_config.global_speed}" if haptic_config.global_speed else ""
+                    lines.append(f"  Haptic: {haptic_config.global_setting}{speed_str}")
+                logger.info('\n'.join(lines))
 
     return profiles
 
 
-def load_config(config_path: str = None) -> Dict[bytes, List[Tuple[int, int, int]]]:
-    """Load button mappings from config file (DEPRECATED - use load_profiles instead)
+def load_default_profiles(config_path: str = DEFAULT_MAPPINGS_PATH) -> List[Profile]:
+    """Load the built-in profiles, using a pre-parsed copy when available
 
-    This function is kept for backward compatibility but will return empty
-    mappings. All configs should use the profile format.
+    The parsed profiles are pickled into the user's cache directory (e.g.
+    ~/.cache/tuxbox/default_mappings.pkl), so later loads skip the INI and
+    action parsing. install.sh creates the copy right after installing the
+    package; otherwise it is written on the first load. The copy is only
+    used while the config file's path, mtime and size, the TuxBox version
+    and the profile code itself are unchanged, otherwise the file is parsed
+    again.
 
     Args:
-        config_path: Path to config file. If None, searches default locations.
+        config_path: Path to the built-in legacy format config file
 
     Returns:
-        Empty dictionary (profiles should be used instead)
+        List of Profile objects
     """
-    logger.warning("load_config() is deprecated - config file should use profile format")
-    return {}, {}
+    try:
+        st = os.stat(config_path)
+        code_stats = [os.stat(path) for path in _DEFAULT_PICKLE_MODULES]
+    except OSError:
+        return load_profiles_from_legacy_file(config_path)
+
+    stamp = (
+        _DEFAULT_PICKLE_FORMAT, VERSION,
+        os.path.abspath(config_path), st.st_mtime_ns, st.st_size,
+        tuple((code_st.st_mtime_ns, code_st.st_size) for code_st in code_stats),
+    )
+    cache_dir = _get_cache_dir()
+    pickle_path = os.path.join(
+        cache_dir, os.path.splitext(os.path.basename(config_path))[0] + '.pkl')
+
+    try:
+        with open(pickle_path, 'rb') as f:
+            # The stamp is stored first so a stale copy is never unpickled
+            if pickle.load(f) == stamp:
+                profiles = pickle.load(f)
+                logger.info(f"Loaded {len(profiles)} built-in profile(s) from {pickle_path}")
+                return profiles
+    except FileNotFoundError:
+        pass
+    except Exception as ex:
+        logger.debug(f"Ignoring unreadable pre-parsed profiles {pickle_path}: {ex}")
+
+    profiles = load_profiles_from_legacy_file(config_path)
+
+    tmp_path = f"{pickle_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(stamp, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(profiles, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except Exception as ex:
+        # e.g. no writable home directory - parsing still works
+        logger.debug(f"Could not write pre-parsed profiles {pickle_path}: {ex}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+    return profiles
+
+
+def _merge_caps(caps: Dict, events: List[Tuple[int, int, int]]):
+    """Add the key and relative event codes used by events to capabilities
+
+    Args:
+        caps: Capabilities dictionary (sets of codes per type) to update in place
+        events: Parsed events (see parse_action)
+    """
+    for event_type, event_code, _ in events:
+        if event_type == e.EV_KEY or event_type == e.EV_REL:
+            caps.setdefault(event_type, set()).add(event_code)
 
 
 def get_capabilities_from_mapping(mapping: Dict) -> Dict:
@@ -559,7 +852,19 @@ def get_capabilities_from_mapping(mapping: Dict) -> Dict:
         mapping: Button mapping dictionary
 
     Returns:
-        Dictionary of capabilities for UInput
+        Dictionary of capabilities for UInput (event codes per type are unordered)
+    """
+    return {event_type: list(codes) for event_type, codes in _capability_sets(mapping).items()}
+
+
+def _capability_sets(mapping: Dict) -> Dict[int, Set[int]]:
+    """Collect key and relative event codes used by a mapping
+
+    Args:
+        mapping: Button mapping dictionary
+
+    Returns:
+        Dictionary of event type -> set of event codes (only types in use)
     """
     keys = set()
     rels = set()
@@ -573,52 +878,62 @@ def get_capabilities_from_mapping(mapping: Dict) -> Dict:
 
     caps = {}
     if keys:
-        caps[e.EV_KEY] = list(keys)
+        caps[e.EV_KEY] = keys
     if rels:
-        caps[e.EV_REL] = list(rels)
+        caps[e.EV_REL] = rels
 
     return caps
 
 
 # Define which controls can be modifiers (physical buttons with press/release events)
-VALID_MODIFIER_BUTTONS = {
+VALID_MODIFIER_BUTTONS = frozenset({
     'side', 'top', 'short', 'tall',
     'c1', 'c2',
     'dpad_up', 'dpad_down', 'dpad_left', 'dpad_right',
     'scroll_click', 'knob_click', 'dial_click',
     'tour'
-}
+})
 
-# Rotary controls that CANNOT be modifiers (momentary, cannot be held)
-INVALID_MODIFIER_CONTROLS = {
+# Rotary controls that CANNOT be modifiers (momentary, cannot be held).
+# Also the set of rotary controls wherever rotation needs press+release events
+INVALID_MODIFIER_CONTROLS = frozenset({
     'scroll_up', 'scroll_down',
     'knob_cw', 'knob_ccw',
     'dial_cw', 'dial_ccw'
-}
+})
 
 
-def parse_modifier_mappings(config: configparser.ConfigParser, section_name: str) -> Tuple[Set[str], Dict[Tuple[str, str], str], Dict[str, str]]:
+def parse_modifier_mappings(config: Dict[str, Dict[str, str]], section_name: str) -> Tuple[Set[str], Dict[Tuple[str, str], str], Dict[str, str], List[Tuple[int, int, int]]]:
     """Parse modifier button configurations from a profile section
 
     Args:
-        config: ConfigParser instance
+        config: Config sections (see read_config_sections)
         section_name: Name of the section (e.g., 'profile:default')
 
     Returns:
-        Tuple of (modifier_buttons, modifier_mappings, modifier_base_actions)
+        Tuple of (modifier_buttons, modifier_mappings, modifier_base_actions, modifier_events)
         - modifier_buttons: Set of button names that are modifiers
         - modifier_mappings: Dict mapping (modifier, control) -> action_string
         - modifier_base_actions: Dict mapping modifier -> base_action_string
+        - modifier_events: Events of all combos and base actions (for capabilities),
+          parsed once while reading the section
     """
     modifier_buttons = set()
     modifier_mappings = {}
     modifier_base_actions = {}
+    modifier_events = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    # Read the section once - both passes below walk the same items
+    items = list(config[section_name].items())
 
     # First pass: identify modifiers
-    for key, value in config[section_name].items():
+    for key, value in items:
         # Check if this is a modifier declaration
         if value.strip() == 'modifier':
-            control_name = key.strip()
+            # Interned so lookups against the (literal, hence already
+            # interned) BUTTON_CODES / modifier names hit the identity check
+            control_name = sys.intern(key.strip())
 
             # Validate that only physical buttons can be modifiers
             if control_name in INVALID_MODIFIER_CONTROLS:
@@ -630,48 +945,51 @@ def parse_modifier_mappings(config: configparser.ConfigParser, section_name: str
                 logger.warning(f"Unknown control declared as modifier: {control_name}")
 
             modifier_buttons.add(control_name)
-            logger.debug(f"Found modifier button: {control_name}")
+            if debug:
+                logger.debug(f"Found modifier button: {control_name}")
 
     # Second pass: parse modifier base actions and combinations
-    for key, value in config[section_name].items():
-        # Skip non-modifier related keys
-        if key in ('window_class', 'window_title', 'app_id'):
+    for key, value in items:
+        # Only "modifier.something" keys (exactly one dot) matter here
+        head, sep, tail = key.partition('.')
+        if not sep or '.' in tail or tail == 'comment':
             continue
 
         # Check for modifier base action: "modifier.base_action = ACTION"
-        if '.base_action' in key and not key.endswith('.comment'):
-            parts = key.split('.')
-            if len(parts) == 2:
-                modifier_name = parts[0].strip()
-                if modifier_name in modifier_buttons:
-                    modifier_base_actions[modifier_name] = value.strip()
+        if tail.startswith('base_action'):
+            modifier_name = sys.intern(head.strip())
+            if modifier_name in modifier_buttons:
+                modifier_base_actions[modifier_name] = value.strip()
+                modifier_events.extend(_parse_action_cached(value.strip()))
+                if debug:
                     logger.debug(f"Found base action for modifier {modifier_name}: {value.strip()}")
 
         # Check for modifier combination: "modifier.control = ACTION"
-        elif '.' in key and not key.endswith('.comment') and not key.endswith('.base_action'):
-            parts = key.split('.')
-            if len(parts) == 2:
-                modifier_name, control_name = parts[0].strip(), parts[1].strip()
-
-                # Check if this is a modifier combination
-                if modifier_name in modifier_buttons:
-                    # Validate: prevent self-referential combos
-                    if modifier_name == control_name:
-                        logger.error(f"Invalid self-referential combo: {key} = {value}")
-                        logger.error(f"A modifier button cannot be combined with itself")
-                        continue
-
-                    modifier_mappings[(modifier_name, control_name)] = value.strip()
+        else:
+            # Interned like the modifier names from the first pass
+            modifier_name, control_name = sys.intern(head.strip()), sys.intern(tail.strip())
+
+            # Check if this is a modifier combination
+            if modifier_name in modifier_buttons:
+                # Validate: prevent self-referential combos
+                if modifier_name == control_name:
+                    logger.error(f"Invalid self-referential combo: {key} = {value}")
+                    logger.error(f"A modifier button cannot be combined with itself")
+                    continue
+
+                modifier_mappings[(modifier_name, control_name)] = value.strip()
+                modifier_events.extend(_parse_action_cached(value.strip()))
+                if debug:
                     logger.debug(f"Found modifier combo: {modifier_name}.{control_name} = {value.strip()}")
 
-    return modifier_buttons, modifier_mappings, modifier_base_actions
+    return modifier_buttons, modifier_mappings, modifier_base_actions, modifier_events
 
 
-def parse_mapping_comments(config: configparser.ConfigParser, section_name: str) -> Tuple[Dict[str, str], Dict[Tuple[str, str], str]]:
+def parse_mapping_comments(config: Dict[str, Dict[str, str]], section_name: str) -> Tuple[Dict[str, str], Dict[Tuple[str, str], str]]:
     """Parse comments for all mappings in a profile section
 
     Args:
-        config: ConfigParser instance
+        config: Config sections (see read_config_sections)
         section_name: Name of the section (e.g., 'profile:default')
 
     Returns:
@@ -681,44 +999,113 @@ def parse_mapping_comments(config: configparser.ConfigParser, section_name: str)
     """
     mapping_comments = {}
     modifier_combo_comments = {}
+    debug = logger.isEnabledFor(logging.DEBUG)
 
     for key, value in config[section_name].items():
-        # Skip non-comment keys
-        if not key.endswith('.comment'):
+        # Skip non-comment keys; what precedes ".comment" is the control/combo name
+        base, sep, suffix = key.rpartition('.')
+        if not sep or suffix != 'comment':
             continue
-
-        # Remove the .comment suffix to get the control/combo name
-        control_key = key[:-len('.comment')].strip()
+        control_key = base.strip()
 
         # Convert escape sequences to actual newlines for multiline support
         comment_text = value.strip().replace('\\n', '\n')
 
         # Check if this is a combo comment: "modifier.control.comment"
-        if '.' in control_key:
-            parts = control_key.split('.')
+        head, sep, tail = control_key.partition('.')
+        if sep:
+            # Anything with more than one dot is not a known comment form
+            if '.' in tail:
+                continue
 
             # Check for base_action comment: "modifier.base_action.comment"
-            if len(parts) == 2 and parts[1] == 'base_action':
+            if tail == 'base_action':
                 # Store as a special mapping comment for the base action
-                modifier_name = parts[0].strip()
+                modifier_name = head.strip()
                 mapping_comments[f"{modifier_name}.base_action"] = comment_text
-                logger.debug(f"Found base action comment for {modifier_name}: {comment_text[:50]}...")
+                if debug:
+                    logger.debug(f"Found base action comment for {modifier_name}: {comment_text[:50]}...")
 
             # Regular combo comment: "modifier.control.comment"
-            elif len(parts) == 2:
-                modifier_name, control_name = parts[0].strip(), parts[1].strip()
+            else:
+                modifier_name, control_name = head.strip(), tail.strip()
                 modifier_combo_comments[(modifier_name, control_name)] = comment_text
-                logger.debug(f"Found combo comment for {modifier_name}.{control_name}: {comment_text[:50]}...")
+                if debug:
+                    logger.debug(f"Found combo comment for {modifier_name}.{control_name}: {comment_text[:50]}...")
 
         # Regular control comment: "control.comment"
         else:
             mapping_comments[control_key] = comment_text
-            logger.debug(f"Found comment for {control_key}: {comment_text[:50]}...")
+            if debug:
+                logger.debug(f"Found comment for {control_key}: {comment_text[:50]}...")
 
     return mapping_comments, modifier_combo_comments
 
 
-def parse_haptic_config(config: configparser.ConfigParser, section_name: str) -> HapticConfig:
+def _parse_haptic_strength_key(haptic_config: HapticConfig, target: Optional[str], value: str):
+    """Apply a haptic strength key (haptic, haptic.DIAL, haptic.DIAL.MODIFIER)
+
+    Args:
+        haptic_config: HapticConfig to update
+        target: Key part after "haptic." (None for the global key)
+        value: Configured strength
+    """
+    if target is None:
+        # Global profile haptic strength setting
+        haptic_config.global_setting = HapticStrength.from_string(value)
+        logger.debug("Parsed global haptic: %s -> %s", value, haptic_config.global_setting)
+        return
+
+    dial, sep, modifier = target.partition('.')
+    if not sep:
+        # Per-dial strength: haptic.knob = weak
+        strength = HapticStrength.from_string(value)
+        haptic_config.dial_settings[dial] = strength
+        logger.debug("Parsed dial haptic: %s = %s", dial, strength)
+
+    elif '.' not in modifier:
+        # Per-combo strength: haptic.knob.tall = strong
+        strength = HapticStrength.from_string(value)
+        haptic_config.combo_settings[(dial, modifier)] = strength
+        logger.debug("Parsed combo haptic: %s.%s = %s", dial, modifier, strength)
+
+
+def _parse_haptic_speed_key(haptic_config: HapticConfig, target: Optional[str], value: str):
+    """Apply a haptic speed key (haptic_speed, haptic_speed.DIAL, haptic_speed.DIAL.MODIFIER)
+
+    Args:
+        haptic_config: HapticConfig to update
+        target: Key part after "haptic_speed." (None for the global key)
+        value: Configured speed
+    """
+    if target is None:
+        # Global haptic speed setting
+        haptic_config.global_speed = HapticSpeed.from_string(value)
+        logger.debug("Parsed global haptic speed: %s -> %s", value, haptic_config.global_speed)
+        return
+
+    dial, sep, modifier = target.partition('.')
+    if not sep:
+        # Per-dial speed: haptic_speed.knob = slow
+        speed = HapticSpeed.from_string(value)
+        haptic_config.dial_speed_settings[dial] = speed
+        logger.debug("Parsed dial haptic speed: %s = %s", dial, speed)
+
+    elif '.' not in modifier:
+        # Per-combo speed: haptic_speed.knob.tall = medium
+        speed = HapticSpeed.from_string(value)
+        haptic_config.combo_speed_settings[(dial, modifier)] = speed
+        logger.debug("Parsed combo haptic speed: %s.%s = %s", dial, modifier, speed)
+
+
+# Haptic key prefix (part before the first dot) -> handler
+_HAPTIC_HANDLERS = {
+    'haptic': _parse_haptic_strength_key,
+    'haptic_speed': _parse_haptic_speed_key,
+}
+
+
+def parse_haptic_config(config: Dict[str, Dict[str, str]], section_name: str) -> HapticConfig:
     """Parse haptic configuration from a profile section
 
     Supports global, per-dial, and per-combo formats for both strength and speed:
@@ -729,7 +1116,7 @@ def parse_haptic_config(config: configparser.ConfigParser, section_name: str) ->
     - Per-combo speed: haptic_speed.knob.tall = medium
 
     Args:
-        config: ConfigParser instance
+        config: Config sections (see read_config_sections)
         section_name: Name of the section (e.g., 'profile:default')
 
     Returns:
@@ -738,47 +1125,10 @@ def parse_haptic_config(config: configparser.ConfigParser, section_name: str) ->
     haptic_config = HapticConfig()
 
     for key, value in config[section_name].items():
-        if key == 'haptic':
-            # Global profile haptic strength setting
-            haptic_config.global_setting = HapticStrength.from_string(value)
-            logger.debug(f"Parsed global haptic: {value} -> {haptic_config.global_setting}")
-
-        elif key == 'haptic_speed':
-            # Global haptic speed setting
-            haptic_config.global_speed = HapticSpeed.from_string(value)
-            logger.debug(f"Parsed global haptic speed: {value} -> {haptic_config.global_speed}")
-
-        elif key.startswith('haptic.'):
-            parts = key.split('.')
-            if len(parts) == 2:
-                # Per-dial strength: haptic.knob = weak
-                dial = parts[1]
-                strength = HapticStrength.from_string(value)
-                haptic_config.dial_settings[dial] = strength
-                logger.debug(f"Parsed dial haptic: {dial} = {strength}")
-
-            elif len(parts) == 3:
-                # Per-combo strength: haptic.knob.tall = strong
-                dial, modifier = parts[1], parts[2]
-                strength = HapticStrength.from_string(value)
-                haptic_config.combo_settings[(dial, modifier)] = strength
-                logger.debug(f"Parsed combo haptic: {dial}.{modifier} = {strength}")
-
-        elif key.startswith('haptic_speed.'):
-            parts = key.split('.')
-            if len(parts) == 2:
-                # Per-dial speed: haptic_speed.knob = slow
-                dial = parts[1]
-                speed = HapticSpeed.from_string(value)
-                haptic_config.dial_speed_settings[dial] = speed
-                logger.debug(f"Parsed dial haptic speed: {dial} = {speed}")
-
-            elif len(parts) == 3:
-                # Per-combo speed: haptic_speed.knob.tall = medium
-                dial, modifier = parts[1], parts[2]
-                speed = HapticSpeed.from_string(value)
-                haptic_config.combo_speed_settings[(dial, modifier)] = speed
-                logger.debug(f"Parsed combo haptic speed: {dial}.{modifier} = {speed}")
+        prefix, sep, target = key.partition('.')
+        handler = _HAPTIC_HANDLERS.get(prefix)
+        if handler is not None:
+            handler(haptic_config, target if sep else None, value)
 
     # Note: global_setting is preserved as the default fallback for dials
     # that don't have a specific per-dial setting ("Use Profile Default").
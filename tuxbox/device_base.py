@@ -11,12 +11,16 @@ import signal
 import logging
 import pathlib
 import asyncio
+import contextlib
 import time
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Set, List, Tuple
 
 from evdev import UInput, ecodes as e
-from .config_loader import load_profiles, load_device_config, BUTTON_CODES, parse_action
+from .config_loader import (
+    load_profiles, load_device_config, BUTTON_CODES, parse_action, INVALID_MODIFIER_CONTROLS,
+    key_code_name, rel_code_name
+)
 from .window_monitor import WindowMonitor
 
 # Keyboard modifier keys - these need to be sent before main keys for proper combo recognition
@@ -39,6 +43,39 @@ HOLDABLE_BUTTONS = {
     'tour'
 }
 
+# Every single-byte code as a bytes object, so process_buffer dispatches
+# buffers without allocating a new object per byte
+_SINGLE_BYTES = tuple(bytes([code]) for code in range(256))
+
+# Button code -> (control_name, is_press), so resolving a code is one int-keyed
+# lookup instead of a scan over BUTTON_CODES
+_CONTROL_BY_CODE = {
+    code: (control_name, is_press)
+    for control_name, codes in BUTTON_CODES.items()
+    for code, is_press in zip(codes, (True, False))
+}
+
+
+def run_event_loop(coro):
+    """Run a driver coroutine, on uvloop if it is installed
+
+    uvloop is optional; without it the standard asyncio loop is used.
+
+    Args:
+        coro: Coroutine to run to completion (e.g. driver.start())
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    logger.debug("Using uvloop event loop")
+    if hasattr(uvloop, 'run'):
+        return uvloop.run(coro)
+    # uvloop < 0.18
+    uvloop.install()
+    return asyncio.run(coro)
+
 
 class GracefulKiller:
     """Handle SIGINT, SIGTERM, and SIGHUP gracefully"""
@@ -46,16 +83,44 @@ class GracefulKiller:
     reload_config = False
 
     def __init__(self):
+        self._wakeup = None
+        self._on_reload = None
         signal.signal(signal.SIGINT, self.exit_gracefully)
         signal.signal(signal.SIGTERM, self.exit_gracefully)
         signal.signal(signal.SIGHUP, self.reload_gracefully)
 
+    def set_wakeup(self, event: asyncio.Event):
+        """Set event (from the running loop) whenever a signal is received
+
+        Lets async code wait on the event instead of polling the flags.
+        Must be called from the event loop the event belongs to.
+        """
+        loop = asyncio.get_running_loop()
+        self._wakeup = lambda: loop.call_soon_threadsafe(event.set)
+
+    def set_reload_handler(self, callback):
+        """Run callback on the running loop whenever SIGHUP is received
+
+        Must be called from the event loop. A SIGHUP that arrived before
+        the handler was set is handled straight away.
+        """
+        loop = asyncio.get_running_loop()
+        self._on_reload = lambda: loop.call_soon_threadsafe(callback)
+        if self.reload_config:
+            self._on_reload()
+
     def exit_gracefully(self, *args):
         self.kill_now = True
+        if self._wakeup:
+            self._wakeup()
 
     def reload_gracefully(self, *args):
         self.reload_config = True
         logger.info("Received SIGHUP - will reload config")
+        if self._on_reload:
+            self._on_reload()
+        if self._wakeup:
+            self._wakeup()
 
 
 class TuxBoxBase(ABC):
@@ -225,14 +290,9 @@ class TuxBoxBase(ABC):
         Returns:
             Tuple of (control_name, is_press) or None if not found
         """
-        for control_name, codes in BUTTON_CODES.items():
-            if len(codes) >= 2:
-                press_code, release_code = codes[0], codes[1]
-                if data_bytes == bytes([press_code]):
-                    return (control_name, True)
-                elif data_bytes == bytes([release_code]):
-                    return (control_name, False)
-        return None
+        if len(data_bytes) != 1:
+            return None
+        return _CONTROL_BY_CODE.get(data_bytes[0])
 
     def get_modified_action(self, control_name: str) -> Optional[List]:
         """Get modified action if a modifier is currently active
@@ -293,7 +353,17 @@ class TuxBoxBase(ABC):
         self._double_click_first_press.clear()
         self._double_click_active_events.clear()
 
-    def process_button_code(self, data: bytearray):
+    def process_buffer(self, data: bytes):
+        """Process each button code in a notification or serial read
+
+        Args:
+            data: Raw data from the device (bytes, bytearray or memoryview)
+        """
+        process = self.process_button_code
+        for code in data:
+            process(_SINGLE_BYTES[code])
+
+    def process_button_code(self, data: bytes):
         """Process button/dial data from TourBox Elite
 
         Each notification is a single byte containing button press/release
@@ -309,7 +379,7 @@ class TuxBoxBase(ABC):
         - Detects second press within timeout window
 
         Args:
-            data: Raw button data (single byte as bytearray)
+            data: Raw button data (single byte)
         """
         self.button_count += 1
 
@@ -324,7 +394,7 @@ class TuxBoxBase(ABC):
             control_name, is_press = control_info
 
             # Skip rotary controls - they can't have double-click
-            is_rotary = control_name in ('scroll_up', 'scroll_down', 'knob_cw', 'knob_ccw', 'dial_cw', 'dial_ccw')
+            is_rotary = control_name in INVALID_MODIFIER_CONTROLS
 
             # Skip on_release controls - they handle double-press differently (in Step 4)
             is_on_release = self.current_profile and control_name in self.current_profile.on_release_controls
@@ -591,7 +661,7 @@ class TuxBoxBase(ABC):
                 event_desc = []
                 for event_type, event_code, value in events_to_send:
                     if event_type == e.EV_KEY:
-                        key_name = next((k for k, v in e.__dict__.items() if (k.startswith('KEY_') or k.startswith('BTN_')) and v == event_code), f"CODE_{event_code}")
+                        key_name = key_code_name(event_code) or f"CODE_{event_code}"
                         action = "PRESS" if value == 1 else "RELEASE" if value == 0 else f"VAL={value}"
                         event_desc.append(f"{key_name}:{action}")
                 logger.info(f"Combo release (tracked): {control_name} -> {', '.join(event_desc)}")
@@ -664,7 +734,7 @@ class TuxBoxBase(ABC):
                 event_desc = []
                 for event_type, event_code, value in events_to_send:
                     if event_type == e.EV_KEY:
-                        key_name = next((k for k, v in e.__dict__.items() if (k.startswith('KEY_') or k.startswith('BTN_')) and v == event_code), f"CODE_{event_code}")
+                        key_name = key_code_name(event_code) or f"CODE_{event_code}"
                         action = "PRESS" if value == 1 else "RELEASE" if value == 0 else f"VAL={value}"
                         event_desc.append(f"{key_name}:{action}")
                 logger.info(f"Combo: {modifier_name}.{control_name} -> {', '.join(event_desc)}")
@@ -762,11 +832,11 @@ class TuxBoxBase(ABC):
                 event_desc = []
                 for event_type, event_code, value in mapping:
                     if event_type == e.EV_KEY:
-                        key_name = next((k for k, v in e.__dict__.items() if (k.startswith('KEY_') or k.startswith('BTN_')) and v == event_code), f"CODE_{event_code}")
+                        key_name = key_code_name(event_code) or f"CODE_{event_code}"
                         action = "PRESS" if value == 1 else "RELEASE" if value == 0 else f"VAL={value}"
                         event_desc.append(f"{key_name}:{action}")
                     elif event_type == e.EV_REL:
-                        rel_name = next((k for k, v in e.__dict__.items() if k.startswith('REL_') and v == event_code), f"REL_{event_code}")
+                        rel_name = rel_code_name(event_code) or f"REL_{event_code}"
                         event_desc.append(f"{rel_name}:{value}")
                 logger.info(f"{data_bytes.hex()} -> {', '.join(event_desc)}")
 
@@ -809,7 +879,7 @@ class TuxBoxBase(ABC):
             events = parse_action(action_str)
             logger.info(f"  Parsing combo {modifier}.{control} = '{action_str}' -> {events}")
             # For rotary controls, add press+release cycle
-            if control in ('scroll_up', 'scroll_down', 'knob_cw', 'knob_ccw', 'dial_cw', 'dial_ccw'):
+            if control in INVALID_MODIFIER_CONTROLS:
                 # Create release events
                 release_events = []
                 for event_type, event_code, value in events:
@@ -821,7 +891,7 @@ class TuxBoxBase(ABC):
             # Log the final stored events with key names
             for event_type, event_code, value in self.modifier_mappings[(modifier, control)]:
                 if event_type == e.EV_KEY:
-                    key_name = next((k for k, v in e.__dict__.items() if (k.startswith('KEY_') or k.startswith('BTN_')) and v == event_code), f"CODE_{event_code}")
+                    key_name = key_code_name(event_code) or f"CODE_{event_code}"
                     logger.info(f"  Event: {key_name} (code={event_code}) value={value}")
 
         # Convert base actions from action strings to events
@@ -860,6 +930,21 @@ class TuxBoxBase(ABC):
             )
             logger.debug(f"Virtual input device recreated: {self.controller.device.path}")
 
+    def handle_config_reloads(self):
+        """Reload config mappings as soon as SIGHUP is received
+
+        Must be called from the running event loop. The reload runs as a loop
+        callback, so the connection loops don't have to check for it.
+        """
+        self.killer.set_reload_handler(self._reload_on_signal)
+
+    def _reload_on_signal(self):
+        """Handle a SIGHUP reload request (runs on the event loop)"""
+        if not self.killer.reload_config:
+            return
+        self.killer.reload_config = False
+        self.reload_config_mappings()
+
     def reload_config_mappings(self):
         """Reload configuration from file and update mappings
 
@@ -910,7 +995,7 @@ class TuxBoxBase(ABC):
             for (modifier, control), action_str in new_current_profile.modifier_mappings.items():
                 events = parse_action(action_str)
                 # For rotary controls, add press+release cycle
-                if control in ('scroll_up', 'scroll_down', 'knob_cw', 'knob_ccw', 'dial_cw', 'dial_ccw'):
+                if control in INVALID_MODIFIER_CONTROLS:
                     release_events = []
                     for event_type, event_code, value in events:
                         if event_type == e.EV_KEY:
@@ -1016,6 +1101,30 @@ class TuxBoxBase(ABC):
         )
         logger.info("Virtual input device created")
 
+    @contextlib.asynccontextmanager
+    async def window_monitor_running(self):
+        """Run window monitoring (if using profiles) for the duration of the block
+
+        The monitor task is cancelled and awaited when the block exits,
+        however it exits.
+        """
+        if not (self.use_profiles and self.window_monitor and self.window_monitor.compositor):
+            yield
+            return
+
+        logger.info("Starting window monitor for profile switching")
+        monitor_task = asyncio.ensure_future(
+            self.window_monitor.monitor_window_changes(self.on_window_change, interval=0.2)
+        )
+        try:
+            yield
+        finally:
+            monitor_task.cancel()
+            try:
+                await monitor_task
+            except asyncio.CancelledError:
+                pass
+
     def cleanup(self):
         """Clean up resources - close virtual device"""
         if self.controller:
@@ -9,18 +9,20 @@ import sys
 import os
 import asyncio
 import logging
-from typing import Optional
+import random
+import time
+from typing import Dict, Optional
 
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
 from dbus_fast.aio import MessageBus
-from dbus_fast import BusType, Message
+from dbus_fast import BusType, Message, MessageType
 from evdev import UInput
 
-from .device_base import TuxBoxBase
+from .device_base import TuxBoxBase, run_event_loop
 from .config_loader import load_profiles
 from .window_monitor import WindowMonitor
-from .haptic import build_config_commands, HapticConfig
+from .haptic import build_config_commands, build_config_message, HapticConfig
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +32,7 @@ NOTIFY_CHAR = "0000fff1-0000-1000-8000-00805f9b34fb"  # Button data notification
 WRITE_CHAR = "0000fff2-0000-1000-8000-00805f9b34fb"   # Commands to device
 
 # Unlock sequence discovered from Windows BLE capture
-UNLOCK_COMMAND = bytes.fromhex("5500078894001afe")
+UNLOCK_COMMAND = b"\x55\x00\x07\x88\x94\x00\x1a\xfe"
 
 # Note: CONFIG_COMMANDS are now built dynamically by build_config_commands()
 # from haptic.py to support per-profile haptic settings
@@ -38,6 +40,157 @@ UNLOCK_COMMAND = bytes.fromhex("5500078894001afe")
 # Device name prefix for scanning
 TOURBOX_NAME_PREFIX = "TourBox"
 
+# Reconnect backoff: initial and maximum delay, and how long a connection
+# must stay up before the delay is reset (seconds)
+RECONNECT_DELAY_INITIAL = 5.0
+RECONNECT_DELAY_MAX = 10.0
+STABLE_CONNECTION_TIME = 30.0
+
+
+# System bus connection reused across reconnects (see _get_system_bus)
+_system_bus: Optional[MessageBus] = None
+
+# Connected state of the TourBox devices known to BlueZ, by object path.
+# Seeded once per bus connection, then kept current from BlueZ signals
+# (see _watch_devices) so a disconnect check is a dictionary lookup
+_tourbox_devices: Dict[str, bool] = {}
+_watched_bus: Optional[MessageBus] = None
+
+# BlueZ interface of device objects
+_DEVICE_INTERFACE = 'org.bluez.Device1'
+
+# Match rules for the BlueZ signals handled by _on_bluez_signal
+_BLUEZ_MATCH_RULES = (
+    "type='signal',sender='org.bluez',interface='org.freedesktop.DBus.ObjectManager'",
+    "type='signal',sender='org.bluez',interface='org.freedesktop.DBus.Properties',"
+    "member='PropertiesChanged',arg0='org.bluez.Device1'",
+)
+
+# Fixed header fields of the D-Bus calls made below. dbus-fast stamps a
+# serial on a Message when it is sent, so each call still needs a fresh
+# Message; only the constant part is built once
+_ADD_MATCH_CALL = dict(
+    destination="org.freedesktop.DBus",
+    path="/org/freedesktop/DBus",
+    interface="org.freedesktop.DBus",
+    member="AddMatch",
+    signature="s",
+)
+_GET_MANAGED_OBJECTS_CALL = dict(
+    destination="org.bluez",
+    path="/",
+    interface="org.freedesktop.DBus.ObjectManager",
+    member="GetManagedObjects",
+)
+_DISCONNECT_CALL = dict(
+    destination="org.bluez",
+    interface=_DEVICE_INTERFACE,
+    member="Disconnect",
+    signature="",
+)
+
+
+def _has_bluetooth_adapter() -> bool:
+    """Check sysfs for a Bluetooth controller (hci*) without touching D-Bus"""
+    try:
+        with os.scandir('/sys/class/bluetooth') as entries:
+            return any(entry.name.startswith('hci') for entry in entries)
+    except OSError:
+        return False
+
+
+async def _get_system_bus() -> MessageBus:
+    """Get the shared system bus connection, connecting on first use"""
+    global _system_bus
+    if _system_bus is None or not _system_bus.connected:
+        _system_bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+    return _system_bus
+
+
+def _update_device(path: str, device_props: Dict):
+    """Record a BlueZ Device1 object if it is a TourBox
+
+    Args:
+        path: Object path of the device
+        device_props: Device1 properties (name -> Variant), possibly partial
+    """
+    alias = device_props.get('Alias')
+    if alias is not None and not alias.value.startswith(TOURBOX_NAME_PREFIX):
+        _tourbox_devices.pop(path, None)
+        return
+
+    if alias is None and path not in _tourbox_devices:
+        return
+
+    connected = device_props.get('Connected')
+    if connected is not None:
+        _tourbox_devices[path] = connected.value
+    else:
+        _tourbox_devices.setdefault(path, False)
+
+
+def _on_bluez_signal(msg: Message):
+    """Apply BlueZ device changes to _tourbox_devices"""
+    if msg.message_type != MessageType.SIGNAL:
+        return
+
+    if msg.member == 'PropertiesChanged' and msg.interface == 'org.freedesktop.DBus.Properties':
+        interface, changed = msg.body[0], msg.body[1]
+        if interface == _DEVICE_INTERFACE:
+            _update_device(msg.path, changed)
+    elif msg.member == 'InterfacesAdded':
+        path, interfaces = msg.body
+        if _DEVICE_INTERFACE in interfaces:
+            _update_device(path, interfaces[_DEVICE_INTERFACE])
+    elif msg.member == 'InterfacesRemoved':
+        path, interfaces = msg.body
+        if _DEVICE_INTERFACE in interfaces:
+            _tourbox_devices.pop(path, None)
+
+
+async def _watch_devices(bus: MessageBus, timeout: float):
+    """Subscribe to BlueZ device signals and seed the device table
+
+    Does nothing if this bus connection is already being watched.
+    """
+    global _watched_bus
+    if _watched_bus is bus:
+        return
+
+    # Subscribe first so no change between the snapshot and the
+    # subscription is missed
+    bus.add_message_handler(_on_bluez_signal)
+    try:
+        for rule in _BLUEZ_MATCH_RULES:
+            msg = Message(**_ADD_MATCH_CALL, body=[rule])
+            await asyncio.wait_for(bus.call(msg), timeout=timeout)
+
+        res = await asyncio.wait_for(bus.call(Message(**_GET_MANAGED_OBJECTS_CALL)), timeout=timeout)
+    except BaseException:
+        bus.remove_message_handler(_on_bluez_signal)
+        raise
+
+    # Seed with the TourBox devices BlueZ already knows - one filtered pass
+    _tourbox_devices.clear()
+    _tourbox_devices.update({
+        path: device['Connected'].value
+        for path, props in res.body[0].items()
+        if (device := props.get(_DEVICE_INTERFACE)) is not None
+        and device['Alias'].value.startswith(TOURBOX_NAME_PREFIX)
+    })
+
+    _watched_bus = bus
+
+
+async def _find_connected_device(bus: MessageBus, timeout: float) -> Optional[str]:
+    """Find a connected TourBox among the BlueZ devices
+
+    Returns:
+        Object path of the connected device, or None
+    """
+    await _watch_devices(bus, timeout)
+    return next((path for path, connected in _tourbox_devices.items() if connected), None)
+
 
 async def disconnect_existing_device(timeout: float = 10.0):
     """
@@ -45,52 +198,34 @@ async def disconnect_existing_device(timeout: float = 10.0):
     if a bluetooth manager automatically connects the device. 
     Disconnect via dbus-fast (bleak dep) before the BLE connection attempt
     """
-    bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
-
-    msg = Message(
-        destination="org.bluez",
-        path="/",
-        interface="org.freedesktop.DBus.ObjectManager",
-        member="GetManagedObjects",
-    )
+    # Nothing can be connected without an adapter (Bluetooth off or
+    # unplugged) - skip the D-Bus connection and queries
+    if not _has_bluetooth_adapter():
+        logger.debug("No Bluetooth adapter found, skipping connected device check")
+        return
 
     try:
-        res = await asyncio.wait_for(bus.call(msg), timeout=timeout)
+        bus = await _get_system_bus()
+        connection_path = await _find_connected_device(bus, timeout)
     except asyncio.TimeoutError:
         logger.warning("Timeout while enumerating bluetooth devices")
         return
     except Exception:
         logger.warning("Error while enumerating bluetooth devices")
         return
-    
-    connection_path = None
-
-    for path, props in res.body[0].items():
-        if 'org.bluez.Device1' not in props:
-            continue
-
-        device_info = props['org.bluez.Device1']
-        if not device_info['Connected'].value or not device_info['Alias'].value.startswith(TOURBOX_NAME_PREFIX):
-            continue
-       
-        connection_path = path
-        break
 
     if not connection_path:
         return
 
     logger.info(f"Found already connected device {connection_path}, disconnecting")
 
-    msg = Message(
-        destination="org.bluez",
-        path=connection_path,
-        interface="org.bluez.Device1",
-        member="Disconnect",
-        signature=""
-    )
+    msg = Message(**_DISCONNECT_CALL, path=connection_path)
 
     try:
         res = await asyncio.wait_for(bus.call(msg), timeout=timeout)
+        if res.message_type == MessageType.ERROR:
+            logger.warning(f"Unable to disconnect {connection_path}: {res.error_name} {res.body}")
+            return
         logger.info(f"Disconnected {connection_path}")
     except asyncio.TimeoutError:
         logger.warning("Unable to disconnect already connected device")
@@ -128,7 +263,12 @@ async def scan_for_tuxbox(timeout: float = 10.0) -> Optional[BLEDevice]:
             found_device = device
             stop_event.set()
 
-    scanner = BleakScanner(detection_callback=detection_callback)
+    # Let BlueZ drop other adverts: Pattern matches a name (or address)
+    # prefix, so only TourBox devices reach the callback
+    scanner = BleakScanner(
+        detection_callback=detection_callback,
+        bluez={"filters": {"Pattern": TOURBOX_NAME_PREFIX, "Transport": "le"}},
+    )
     await scanner.start()
 
     try:
@@ -164,11 +304,17 @@ class TuxBoxBLE(TuxBoxBase):
         self.device: Optional[BLEDevice] = None  # Discovered device from scanning
         self.client: Optional[BleakClient] = None
         self.disconnected = False
-        self.reconnect_delay = 5.0  # Initial reconnection delay in seconds
+        self.reconnect_delay = RECONNECT_DELAY_INITIAL  # Current reconnection backoff
+        # Haptic config last sent on the current connection (see send_haptic_config)
+        self._sent_config: Optional[bytes] = None
+        # Set on disconnect and on signals (created in start(), on the running loop)
+        self._wake_event: Optional[asyncio.Event] = None
 
     def disconnection_handler(self, client):
         """Handle disconnection from TourBox Elite"""
         self.disconnected = True
+        if self._wake_event:
+            self._wake_event.set()
         # Clear modifier state on disconnect to prevent stuck modifiers
         self.clear_modifier_state()
         logger.warning("TourBox Elite disconnected")
@@ -177,10 +323,9 @@ class TuxBoxBLE(TuxBoxBase):
     def notification_handler(self, sender, data: bytearray):
         """Handle button/dial notifications from TourBox Elite
 
-        Wraps the base class process_button_code method for BLE notifications.
+        Wraps the base class process_buffer method for BLE notifications.
         """
-        for byte in data:
-            self.process_button_code(bytearray([byte]))
+        self.process_buffer(data)
 
     async def send_haptic_config(self):
         """Send haptic configuration to the device
@@ -196,12 +341,30 @@ class TuxBoxBLE(TuxBoxBase):
             haptic_config = self.current_profile.haptic_config
             logger.info(f"Sending haptic config for profile '{self.current_profile.name}': {haptic_config}")
 
-        config_commands = build_config_commands(haptic_config)
+        config = build_config_message(haptic_config)
 
-        # Send configuration commands
-        for cmd in config_commands:
-            await self.client.write_gatt_char(WRITE_CHAR, cmd, response=False)
-            await asyncio.sleep(0.01)
+        # Profiles often share haptic settings - skip switches that would
+        # send the device the config it already has on this connection
+        if config == self._sent_config:
+            logger.debug("Haptic configuration unchanged, not resending")
+            return
+
+        client = self.client
+        if len(config) <= client.mtu_size - 3:
+            # The message is length-framed (its header carries the length,
+            # USB sends it whole), so one write suffices if the MTU allows
+            await client.write_gatt_char(WRITE_CHAR, config, response=False)
+        else:
+            # Send the 20-byte configuration packets. Writes without response
+            # don't wait on the GATT layer, so issue them together (in order)
+            # and let the stack queue several per connection event
+            await asyncio.gather(*(
+                client.write_gatt_char(WRITE_CHAR, cmd, response=False)
+                for cmd in build_config_commands(haptic_config)
+            ))
+        # Give the queued packets time to go out before anything else is sent
+        await asyncio.sleep(0.05)
+        self._sent_config = config
 
         logger.info("Haptic configuration sent")
 
@@ -213,6 +376,9 @@ class TuxBoxBLE(TuxBoxBase):
         """
         logger.info("Sending unlock command...")
 
+        # New connection - the device's config is unknown until sent
+        self._sent_config = None
+
         # Send unlock command
         await self.client.write_gatt_char(WRITE_CHAR, UNLOCK_COMMAND, response=False)
         await asyncio.sleep(0.1)
@@ -224,6 +390,25 @@ class TuxBoxBLE(TuxBoxBase):
 
         logger.info("Device unlocked and configured")
 
+    async def _negotiate_mtu(self, client: BleakClient):
+        """Have BlueZ exchange the ATT MTU before the first writes
+
+        BlueZ otherwise only negotiates the MTU lazily, so the unlock and
+        config packets would go out at the 23-byte default. Only the BlueZ
+        backend exposes this (through a private bleak method); other
+        backends negotiate on connect. Connection interval updates are not
+        available through the BlueZ D-Bus API.
+        """
+        acquire_mtu = getattr(getattr(client, '_backend', None), '_acquire_mtu', None)
+        if acquire_mtu is None:
+            return
+
+        try:
+            await acquire_mtu()
+            logger.info(f"Negotiated MTU: {client.mtu_size}")
+        except Exception as ex:
+            logger.debug(f"MTU exchange not available: {ex}")
+
     async def connect(self) -> bool:
         """Connect to the TourBox via BLE
 
@@ -262,14 +447,23 @@ class TuxBoxBLE(TuxBoxBase):
             logger.info(f"Connecting to {self.device_name} at {self.device.address}...")
             self.disconnected = False
 
-            async with BleakClient(
-                self.device.address,
-                timeout=5.0,
-                disconnected_callback=self.disconnection_handler
-            ) as client:
+            # Keep one client per device across reconnects - created from the
+            # scanned BLEDevice, so bleak doesn't have to look the address up
+            client = self.client
+            if client is None or client.address != self.device.address:
+                client = BleakClient(
+                    self.device,
+                    timeout=5.0,
+                    disconnected_callback=self.disconnection_handler
+                )
                 self.client = client
+
+            await client.connect()
+            try:
                 logger.info("Connected to TourBox Elite")
 
+                await self._negotiate_mtu(client)
+
                 # Unlock device and send configuration
                 await self.unlock_device()
 
@@ -286,17 +480,21 @@ class TuxBoxBLE(TuxBoxBase):
 
                 print("Press Ctrl+C to exit")
 
-                # Reset reconnect delay on successful connection
-                self.reconnect_delay = 5.0
+                connected_since = time.monotonic()
+
+                # Keep running until disconnected or killed - sleep until the
+                # disconnect callback or a signal wakes us up
+                while True:
+                    self._wake_event.clear()
+                    if self.killer.kill_now or self.disconnected:
+                        break
 
-                # Keep running until disconnected or killed
-                while not self.killer.kill_now and not self.disconnected:
-                    # Check if config reload was requested
-                    if self.killer.reload_config:
-                        self.reload_config_mappings()
-                        self.killer.reload_config = False
+                    await self._wake_event.wait()
 
-                    await asyncio.sleep(0.5)
+                # Only reset the backoff after a stable connection, so a
+                # flaky link doesn't reconnect at the shortest delay each time
+                if time.monotonic() - connected_since > STABLE_CONNECTION_TIME:
+                    self.reconnect_delay = RECONNECT_DELAY_INITIAL
 
                 # Check if user requested exit
                 if self.killer.kill_now:
@@ -306,6 +504,9 @@ class TuxBoxBLE(TuxBoxBase):
 
                 # Device disconnected, will reconnect
                 return True
+            finally:
+                if client.is_connected:
+                    await client.disconnect()
 
         except asyncio.TimeoutError:
             logger.error("Connection timeout - device not found")
@@ -320,8 +521,15 @@ class TuxBoxBLE(TuxBoxBase):
         """Start the TourBox BLE driver with automatic reconnection"""
         import pathlib
 
-        # Load profiles from config
-        self.profiles = load_profiles(self.config_path)
+        self._wake_event = asyncio.Event()
+        self.killer.set_wakeup(self._wake_event)
+
+        # Load profiles and detect the compositor in worker threads, so the
+        # file parsing and the compositor probes overlap
+        profiles_task = asyncio.ensure_future(asyncio.to_thread(load_profiles, self.config_path))
+        window_monitor_task = asyncio.ensure_future(asyncio.to_thread(WindowMonitor))
+
+        self.profiles = await profiles_task
 
         if not self.profiles:
             logger.error("No profiles found in config file")
@@ -359,7 +567,7 @@ class TuxBoxBLE(TuxBoxBase):
             logger.warning(f"No 'default' profile found, using '{self.profiles[0].name}' as fallback")
 
         # Initialize window monitor
-        self.window_monitor = WindowMonitor()
+        self.window_monitor = await window_monitor_task
 
         # Write PID file
         pid = str(os.getpid())
@@ -369,45 +577,30 @@ class TuxBoxBLE(TuxBoxBase):
         # Create virtual input device (persists across reconnections)
         self.create_virtual_device()
 
-        # Start window monitoring if using profiles
-        monitor_task = None
-        if self.use_profiles and self.window_monitor and self.window_monitor.compositor:
-            logger.info("Starting window monitor for profile switching")
-            monitor_task = asyncio.create_task(
-                self.window_monitor.monitor_window_changes(self.on_window_change, interval=0.2)
-            )
+        # Reload config mappings whenever SIGHUP arrives
+        self.handle_config_reloads()
 
-        # Connection loop with automatic reconnection
+        # Connection loop with automatic reconnection, with the window
+        # monitor (if using profiles) running alongside
         try:
-            while not self.killer.kill_now:
-                # Check if config reload was requested
-                if self.killer.reload_config:
-                    self.reload_config_mappings()
-                    self.killer.reload_config = False
-
-                should_retry = await self.run_connection()
-
-                if not should_retry:
-                    break
-
-                # Wait before reconnecting with exponential backoff
-                if not self.killer.kill_now:
-                    delay = min(self.reconnect_delay, 10.0)  # Cap at 10 seconds
-                    logger.info(f"Attempting to reconnect in {delay} seconds...")
-                    print(f"Reconnecting in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                    self.reconnect_delay = min(self.reconnect_delay * 1.5, 10.0)
+            async with self.window_monitor_running():
+                while not self.killer.kill_now:
+                    should_retry = await self.run_connection()
+
+                    if not should_retry:
+                        break
+
+                    # Wait before reconnecting with exponential backoff, with full
+                    # jitter so reconnect attempts don't synchronize
+                    if not self.killer.kill_now:
+                        delay = random.uniform(0, min(self.reconnect_delay, RECONNECT_DELAY_MAX))
+                        logger.info(f"Attempting to reconnect in {delay:.1f} seconds...")
+                        print(f"Reconnecting in {delay:.1f} seconds...")
+                        await asyncio.sleep(delay)
+                        self.reconnect_delay = min(self.reconnect_delay * 1.5, RECONNECT_DELAY_MAX)
         except KeyboardInterrupt:
             pass
         finally:
-            # Cancel monitor task if running
-            if monitor_task:
-                monitor_task.cancel()
-                try:
-                    await monitor_task
-                except asyncio.CancelledError:
-                    pass
-
             # Cleanup
             self.cleanup()
             logger.info("TuxBox BLE driver stopped")
@@ -438,7 +631,7 @@ def main():
     driver = TuxBoxBLE(config_path=args.config)
 
     try:
-        asyncio.run(driver.start())
+        run_event_loop(driver.start())
     except KeyboardInterrupt:
         print("\nExited by user")
     except Exception as ex:
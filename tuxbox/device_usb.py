@@ -7,6 +7,7 @@ Uses the same button code protocol as BLE, but over USB CDC ACM serial.
 
 import sys
 import os
+import errno
 import asyncio
 import logging
 import pathlib
@@ -14,7 +15,7 @@ from typing import Optional
 
 import serial
 
-from .device_base import TuxBoxBase
+from .device_base import TuxBoxBase, run_event_loop
 from .config_loader import load_profiles, load_device_config
 from .window_monitor import WindowMonitor
 from .haptic import build_config_message_usb, HapticConfig
@@ -24,8 +25,16 @@ logger = logging.getLogger(__name__)
 # USB Configuration
 DEFAULT_USB_PORT = "/dev/ttyACM0"
 
+# Bytes to take per read when the port becomes readable. Button codes are
+# single bytes, so this drains any burst the tty has buffered in one syscall
+READ_CHUNK_SIZE = 256
+
 # Unlock command (same as BLE)
-UNLOCK_COMMAND = bytes.fromhex("5500078894001afe")
+UNLOCK_COMMAND = b"\x55\x00\x07\x88\x94\x00\x1a\xfe"
+
+# Unlock response length, and how long to wait for it
+UNLOCK_RESPONSE_SIZE = 26
+UNLOCK_RESPONSE_TIMEOUT = 0.3
 
 # Note: CONFIG_COMMANDS are now built dynamically by build_config_message_usb()
 # from haptic.py to support per-profile haptic settings
@@ -48,7 +57,8 @@ class TuxBoxUSB(TuxBoxBase):
     """
 
     def __init__(self, port: str = None, pidfile: Optional[str] = None,
-                 config_path: Optional[str] = None, force_haptics: bool = False):
+                 config_path: Optional[str] = None, force_haptics: bool = False,
+                 serial_handle: Optional[serial.Serial] = None):
         """Initialize the USB driver
 
         Args:
@@ -56,12 +66,24 @@ class TuxBoxUSB(TuxBoxBase):
             pidfile: Path to PID file
             config_path: Path to configuration file
             force_haptics: Force enable haptics even for ambiguous device PIDs
+            serial_handle: Already open serial port for this port (e.g., from
+                the auto-detect probe), used for the first connection instead
+                of opening the port again
         """
         super().__init__(pidfile=pidfile, config_path=config_path)
         self.port = port or DEFAULT_USB_PORT
         self.serial: Optional[serial.Serial] = None
+        self._serial_handle = serial_handle
         self.reconnect_delay = 5.0
-        self._read_task: Optional[asyncio.Task] = None
+        self._fd: Optional[int] = None
+        # Receive buffer reused by every read (see _on_readable)
+        self._rx_buffer = bytearray(READ_CHUNK_SIZE)
+        self._rx_view = memoryview(self._rx_buffer)
+        # Set on disconnect, signals and port add/remove (created in start(),
+        # on the running loop)
+        self._wake_event: Optional[asyncio.Event] = None
+        # udev monitor for tty add/remove events (None without pyudev)
+        self._udev_monitor = None
         self._connected = False
         self.force_haptics = force_haptics
         self.haptics_enabled = True  # Will be set based on device detection
@@ -82,17 +104,31 @@ class TuxBoxUSB(TuxBoxBase):
         haptic_config = None
         if self.current_profile and self.current_profile.haptic_config:
             haptic_config = self.current_profile.haptic_config
-            logger.info(f"Sending haptic config for profile '{self.current_profile.name}': {haptic_config}")
+            logger.info("Sending haptic config for profile '%s': %s", self.current_profile.name, haptic_config)
 
         config_message = build_config_message_usb(haptic_config)
 
-        # Send configuration
+        # Send configuration. No flush: tcdrain would block the event loop
+        # until the tty has transmitted it, and nothing here needs that
         self.serial.write(config_message)
-        self.serial.flush()
         await asyncio.sleep(0.05)
 
         logger.info("Haptic configuration sent")
 
+    def _set_low_latency(self):
+        """Ask the tty driver to deliver received bytes without batching
+
+        Sets ASYNC_LOW_LATENCY through TIOCSSERIAL (pyserial's
+        set_low_latency_mode), which stops drivers with a latency timer from
+        holding bytes back for up to ~16ms. Drivers without serial info
+        support reject it, which is harmless.
+        """
+        try:
+            self.serial.set_low_latency_mode(True)
+            logger.debug("Enabled low latency mode on %s", self.port)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.debug("Low latency mode not available on %s: %s", self.port, e)
+
     async def connect(self) -> bool:
         """Connect to TourBox Elite via USB serial
 
@@ -107,12 +143,21 @@ class TuxBoxUSB(TuxBoxBase):
                 logger.error(f"Port {self.port} does not exist")
                 return False
 
-            # Open serial port
-            self.serial = serial.Serial(
-                port=self.port,
-                baudrate=115200,
-                timeout=0.1
-            )
+            # Open serial port, or take over the one left open by the probe
+            handle, self._serial_handle = self._serial_handle, None
+            if handle is not None and handle.is_open and handle.port == self.port:
+                handle.timeout = 0.1
+                self.serial = handle
+            else:
+                if handle is not None:
+                    handle.close()
+                self.serial = serial.Serial(
+                    port=self.port,
+                    baudrate=115200,
+                    timeout=0.1
+                )
+
+            self._set_low_latency()
 
             # Clear any pending data
             self.serial.reset_input_buffer()
@@ -120,13 +165,17 @@ class TuxBoxUSB(TuxBoxBase):
             # Send unlock command
             logger.info("Sending unlock command...")
             self.serial.write(UNLOCK_COMMAND)
-            self.serial.flush()
-            await asyncio.sleep(0.3)
 
-            # Read unlock response (expect 26 bytes)
-            response = self.serial.read(100)
+            # Wait for the unlock response (expect 26 bytes), giving up after
+            # 300ms, then take what is buffered rather than blocking the event
+            # loop in the read timeout
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + UNLOCK_RESPONSE_TIMEOUT
+            while self.serial.in_waiting < UNLOCK_RESPONSE_SIZE and loop.time() < deadline:
+                await asyncio.sleep(0.005)
+            response = self.serial.read(self.serial.in_waiting)
             if response:
-                logger.info(f"Unlock response ({len(response)} bytes): {response.hex()}")
+                logger.info("Unlock response (%d bytes): %s", len(response), response.hex())
             else:
                 logger.warning("No response to unlock command")
 
@@ -149,52 +198,116 @@ class TuxBoxUSB(TuxBoxBase):
         """Close USB serial connection"""
         self._connected = False
 
-        if self._read_task:
-            self._read_task.cancel()
-            try:
-                await self._read_task
-            except asyncio.CancelledError:
-                pass
-            self._read_task = None
+        self._stop_reader()
 
         if self.serial and self.serial.is_open:
             self.serial.close()
             logger.info("USB connection closed")
 
-    async def _read_loop(self):
-        """Async loop to read USB button codes"""
-        loop = asyncio.get_event_loop()
-
-        while self._connected:
-            try:
-                # Check for available data (non-blocking check)
-                if self.serial.in_waiting > 0:
-                    # Read available bytes
-                    data = await loop.run_in_executor(
-                        None,
-                        lambda: self.serial.read(self.serial.in_waiting)
-                    )
-
-                    # Process each byte as a button code (same as BLE)
-                    for byte in data:
-                        self.process_button_code(bytearray([byte]))
-                else:
-                    # Small sleep to avoid busy loop
-                    await asyncio.sleep(0.01)
-
-            except asyncio.CancelledError:
-                break
-            except serial.SerialException as e:
-                logger.error(f"Serial read error: {e}")
-                self._connected = False
+    def _on_readable(self):
+        """Read button codes when the serial fd becomes readable
+
+        Registered with the event loop via add_reader, so the kernel's
+        readiness notification drives reads and nothing runs while idle.
+        """
+        try:
+            # Read into the preallocated buffer, so no bytes object is
+            # created per read
+            count = os.readv(self._fd, (self._rx_buffer,))
+        except BlockingIOError:
+            return
+        except OSError as e:
+            if e.errno == errno.EIO:
+                logger.warning("USB device I/O error (errno 5); treating as disconnect")
+            else:
+                logger.error("USB read error: %s", e)
+            self._stop_reader()
+            self._connected = False
+            self._wake_event.set()
+            return
+
+        if not count:
+            # EOF - the tty went away
+            logger.warning("Port %s closed - device unplugged?", self.port)
+            self._stop_reader()
+            self._connected = False
+            self._wake_event.set()
+            return
+
+        # Process each byte as a button code (same as BLE)
+        self.process_buffer(self._rx_view[:count])
+
+    def _start_port_watch(self):
+        """Watch udev for the serial port being added or removed
+
+        Requires the optional pyudev package. Without it (or if the monitor
+        can't be opened) the port is polled instead.
+        """
+        try:
+            import pyudev
+        except ImportError:
+            logger.debug("pyudev not installed - polling for the USB port")
+            return
+
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('tty')
+            monitor.start()
+            asyncio.get_running_loop().add_reader(monitor.fileno(), self._on_udev_event)
+        except Exception as e:
+            logger.debug(f"udev monitor unavailable, polling for the USB port: {e}")
+            return
+
+        self._udev_monitor = monitor
+
+    def _stop_port_watch(self):
+        """Stop watching udev for the serial port"""
+        if self._udev_monitor is not None:
+            asyncio.get_running_loop().remove_reader(self._udev_monitor.fileno())
+            self._udev_monitor = None
+
+    def _on_udev_event(self):
+        """Wake the wait for our port when udev reports a tty added or removed
+
+        The configured port is often a /dev/serial/by-id symlink whose target
+        changes across replugs, so rather than matching nodes every tty
+        add/remove wakes the waiter, which then re-checks the port itself.
+        """
+        while True:
+            device = self._udev_monitor.poll(timeout=0)
+            if device is None:
                 break
-            except Exception as e:
-                if isinstance(e, OSError) and getattr(e, "errno", None) == 5:
-                    logger.warning("USB device I/O error (errno 5); treating as disconnect")
-                    self._connected = False
-                    break
-                logger.error(f"USB read error: {e}")
-                await asyncio.sleep(0.1)
+            if device.action in ('add', 'remove'):
+                logger.debug("udev: %s %s", device.action, device.device_node)
+                self._wake_event.set()
+
+    async def _wait_for_wakeup(self, poll_interval: float):
+        """Sleep until a signal or port add/remove wakes us up
+
+        Without a udev watch the port can't announce itself, so also return
+        after poll_interval seconds for the caller to recheck it.
+
+        Args:
+            poll_interval: Seconds between port checks when polling
+        """
+        if self._udev_monitor is not None:
+            await self._wake_event.wait()
+            return
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    def _start_reader(self):
+        """Register the serial fd with the event loop"""
+        self._fd = self.serial.fileno()
+        asyncio.get_running_loop().add_reader(self._fd, self._on_readable)
+
+    def _stop_reader(self):
+        """Unregister the serial fd from the event loop"""
+        if self._fd is not None:
+            asyncio.get_running_loop().remove_reader(self._fd)
+            self._fd = None
 
     async def run_connection(self) -> bool:
         """Run a single USB connection session
@@ -218,23 +331,17 @@ class TuxBoxUSB(TuxBoxBase):
             # Reset reconnect delay on successful connection
             self.reconnect_delay = 5.0
 
-            # Start read loop
-            self._read_task = asyncio.create_task(self._read_loop())
+            # Read button codes whenever the port becomes readable
+            self._start_reader()
 
-            # Main loop - check for signals and port status
-            while not self.killer.kill_now and self._connected:
-                # Check if config reload was requested
-                if self.killer.reload_config:
-                    self.reload_config_mappings()
-                    self.killer.reload_config = False
-
-                # Check if port still exists (device unplugged?)
-                if not os.path.exists(self.port):
-                    logger.warning(f"Port {self.port} disappeared - device unplugged?")
-                    self._connected = False
+            # Sleep until the reader sees the port close (an unplugged tty is
+            # hung up, which wakes the reader with EOF or EIO) or a signal
+            # arrives - nothing needs polling while connected
+            while True:
+                self._wake_event.clear()
+                if self.killer.kill_now or not self._connected:
                     break
-
-                await asyncio.sleep(0.5)
+                await self._wake_event.wait()
 
             # Cleanup
             await self.disconnect()
@@ -256,6 +363,9 @@ class TuxBoxUSB(TuxBoxBase):
     async def start(self):
         """Start the TourBox USB driver with automatic reconnection"""
 
+        self._wake_event = asyncio.Event()
+        self.killer.set_wakeup(self._wake_event)
+
         # Load profiles from config
         self.profiles = load_profiles(self.config_path)
 
@@ -306,53 +416,41 @@ class TuxBoxUSB(TuxBoxBase):
         # Create virtual input device
         self.create_virtual_device()
 
-        # Start window monitoring if using profiles
-        monitor_task = None
-        if self.use_profiles and self.window_monitor and self.window_monitor.compositor:
-            logger.info("Starting window monitor for profile switching")
-            monitor_task = asyncio.create_task(
-                self.window_monitor.monitor_window_changes(self.on_window_change, interval=0.2)
-            )
+        # Reload config mappings whenever SIGHUP arrives
+        self.handle_config_reloads()
 
-        # Connection loop with automatic reconnection
+        # Connection loop with automatic reconnection, with the window
+        # monitor (if using profiles) running alongside
         try:
-            while not self.killer.kill_now:
-                # Check if config reload was requested
-                if self.killer.reload_config:
-                    self.reload_config_mappings()
-                    self.killer.reload_config = False
-
-                # Check if port exists before trying to connect
-                if not os.path.exists(self.port):
-                    logger.debug(f"Waiting for {self.port} to appear...")
-                    await asyncio.sleep(2.0)
-                    continue
-
-                should_retry = await self.run_connection()
-
-                if not should_retry:
-                    break
-
-                # Wait before reconnecting with exponential backoff
-                if not self.killer.kill_now:
-                    delay = min(self.reconnect_delay, 10.0)
-                    logger.info(f"Attempting to reconnect in {delay} seconds...")
-                    print(f"Reconnecting in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                    self.reconnect_delay = min(self.reconnect_delay * 1.5, 10.0)
+            self._start_port_watch()
+            async with self.window_monitor_running():
+                while not self.killer.kill_now:
+                    self._wake_event.clear()
+
+                    # Check if port exists before trying to connect
+                    if not os.path.exists(self.port):
+                        logger.debug("Waiting for %s to appear...", self.port)
+                        await self._wait_for_wakeup(2.0)
+                        continue
+
+                    should_retry = await self.run_connection()
+
+                    if not should_retry:
+                        break
+
+                    # Wait before reconnecting with exponential backoff
+                    if not self.killer.kill_now:
+                        delay = min(self.reconnect_delay, 10.0)
+                        logger.info(f"Attempting to reconnect in {delay} seconds...")
+                        print(f"Reconnecting in {delay} seconds...")
+                        await asyncio.sleep(delay)
+                        self.reconnect_delay = min(self.reconnect_delay * 1.5, 10.0)
 
         except KeyboardInterrupt:
             pass
         finally:
-            # Cancel monitor task if running
-            if monitor_task:
-                monitor_task.cancel()
-                try:
-                    await monitor_task
-                except asyncio.CancelledError:
-                    pass
-
             # Cleanup
+            self._stop_port_watch()
             await self.disconnect()
             self.cleanup()
             logger.info("TuxBox USB driver stopped")
@@ -401,7 +499,7 @@ def main():
     driver = TuxBoxUSB(port=port, config_path=args.config, force_haptics=force_haptics)
 
     try:
-        asyncio.run(driver.start())
+        run_event_loop(driver.start())
     except KeyboardInterrupt:
         print("\nExited by user")
     except Exception as e:
@@ -92,18 +92,22 @@ class BLEListener(QObject):
         await self.client.write_gatt_char(WRITE_CHAR, UNLOCK_COMMAND, response=False)
         await asyncio.sleep(0.1)
 
-        # Send configuration commands
-        for cmd in CONFIG_COMMANDS:
-            await self.client.write_gatt_char(WRITE_CHAR, cmd, response=False)
-            await asyncio.sleep(0.01)
+        # Send configuration commands. Writes without response don't wait on
+        # the GATT layer, so issue them together (in order)
+        await asyncio.gather(*(
+            self.client.write_gatt_char(WRITE_CHAR, cmd, response=False)
+            for cmd in CONFIG_COMMANDS
+        ))
 
         logger.info("Device unlocked")
 
     def _notification_handler(self, sender, data: bytearray):
         """Handle button notifications from TourBox Elite"""
-        data_bytes = bytes(data)
-        logger.debug(f"Received: {data_bytes.hex()}")
-        self.button_pressed.emit(data_bytes)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received: %s", data.hex())
+        # bleak may reuse the notification buffer, so the signal carries
+        # its own copy
+        self.button_pressed.emit(bytes(data))
 
     def _on_disconnect(self, client):
         """Handle disconnection"""
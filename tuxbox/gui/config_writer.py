@@ -6,13 +6,17 @@ Handles saving profile mappings back to the config file with atomic writes and b
 
 import os
 import configparser
+import contextlib
 import logging
 import shutil
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from evdev import ecodes as e
 
-from tuxbox.config_loader import get_config_path, BUTTON_CODES, Profile, create_button_mapping
+from tuxbox.config_loader import (
+    get_config_path, BUTTON_CODES, Profile, create_button_mapping, key_code_name, rel_code_name
+)
 from tuxbox.haptic import HapticStrength, HapticSpeed
 from tuxbox.profile_io import (
     has_profiles_dir, save_profile_to_file, get_profile_filepath,
@@ -105,15 +109,14 @@ def events_to_action_string(events) -> str:
     for event_type, event_code, value in events:
         if event_type == e.EV_KEY and value == 1:  # Key press or mouse button
             # Find the KEY_ or BTN_ name
-            for name, code in e.__dict__.items():
-                if (name.startswith('KEY_') or name.startswith('BTN_')) and code == event_code:
-                    parts.append(name)
-                    break
+            name = key_code_name(event_code)
+            if name:
+                parts.append(name)
         elif event_type == e.EV_REL:  # Relative movement
             # Find the REL_ name
-            for name, code in e.__dict__.items():
-                if name.startswith('REL_') and code == event_code:
-                    return f"{name}:{value}"  # REL events are standalone
+            name = rel_code_name(event_code)
+            if name:
+                return f"{name}:{value}"  # REL events are standalone
 
     return "+".join(parts) if parts else "none"
 
@@ -160,6 +163,212 @@ def get_profile_actions(profile: Profile, modifications: Optional[Dict[str, str]
     return actions
 
 
+class _ConfigEditor:
+    """Legacy config file lines shared by a batch of saves
+
+    See batch_config_saves().
+    """
+
+    def __init__(self, config_path: Optional[str] = None):
+        self.config_path = config_path
+        self.backup_path: Optional[str] = None
+        self.lines: List[str] = []
+        self.modified = False
+        self.success = True  # False if the final write failed
+
+    def open(self) -> bool:
+        """Back up and read the config file
+
+        Returns:
+            True if the file was read, False otherwise
+        """
+        try:
+            self.backup_path = _create_backup(self.config_path)
+            with open(self.config_path, 'r') as f:
+                self.lines = f.readlines()
+            return True
+        except Exception as e:
+            logger.error(f"Error reading config for batched save: {e}")
+            return False
+
+    def commit(self):
+        """Write the edited lines back if any save changed them"""
+        if not self.modified:
+            return
+        try:
+            _atomic_write_lines(self.config_path, self.lines)
+        except Exception as e:
+            logger.error(f"Error writing config: {e}", exc_info=True)
+            self.success = False
+
+
+# Editor of the batch_config_saves() block in progress, if any
+_active_editor: Optional[_ConfigEditor] = None
+
+
+@contextlib.contextmanager
+def batch_config_saves():
+    """Group a series of legacy-format saves into one read, backup and write
+
+    Inside the block, save_profile, save_modifier_config,
+    save_mapping_comments, save_haptic_config and save_profile_metadata
+    edit a shared copy of the config file's lines; the file is written once
+    when the block exits without an exception. Does nothing when the
+    profiles directory format is in use.
+
+    Yields:
+        _ConfigEditor whose success attribute is False if the final write
+        failed
+    """
+    global _active_editor
+
+    config_path = None
+    if _active_editor is None and not _using_new_format():
+        config_path = get_config_path()
+
+    editor = _ConfigEditor(config_path)
+    if not config_path or not editor.open():
+        # Nothing to batch - saves read and write the file themselves
+        yield editor
+        return
+
+    _active_editor = editor
+    try:
+        yield editor
+    finally:
+        _active_editor = None
+    editor.commit()
+
+
+# Minimum seconds between backups of the config file taken by saves, so a
+# burst of saves copies the file once
+BACKUP_MIN_INTERVAL = 5.0
+
+# Config path -> time.monotonic() of the last backup taken by a save
+_last_backup_time: Dict[str, float] = {}
+
+
+def _create_backup(config_path: str) -> Optional[str]:
+    """Copy the config file to a timestamped backup
+
+    Skipped if a backup of the file was taken within BACKUP_MIN_INTERVAL
+    seconds; that one already holds the config from before the burst of
+    saves. Saves write atomically, so a failed save doesn't need a backup to
+    recover from.
+
+    Returns:
+        Path of the backup file, or None if the backup was skipped
+    """
+    now = time.monotonic()
+    last = _last_backup_time.get(config_path)
+    if last is not None and now - last < BACKUP_MIN_INTERVAL:
+        logger.debug("Skipping backup - config was backed up %.1fs ago", now - last)
+        return None
+
+    backup_path = f"{config_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    shutil.copy2(config_path, backup_path)
+    _last_backup_time[config_path] = now
+    logger.info(f"Created backup: {backup_path}")
+    return backup_path
+
+
+def _backup_config(config_path: str) -> Optional[str]:
+    """Back up the config file before a legacy save
+
+    In a batch the backup taken when the batch started is reused.
+
+    Returns:
+        Path of the backup file, or None if the backup was skipped
+    """
+    if _active_editor is not None:
+        return _active_editor.backup_path
+    return _create_backup(config_path)
+
+
+def _read_config_lines(config_path: str) -> List[str]:
+    """Read the config file as lines (the batch's copy, if in a batch)"""
+    if _active_editor is not None:
+        return list(_active_editor.lines)
+    # Read file as lines to preserve comments and formatting
+    with open(config_path, 'r') as f:
+        return f.readlines()
+
+
+def _atomic_write_lines(config_path: str, lines: List[str]):
+    """Write lines to the config file atomically"""
+    # Write to temporary file first (atomic write)
+    temp_path = f"{config_path}.tmp"
+    with open(temp_path, 'w') as f:
+        f.writelines(lines)
+
+    # Rename temp file to actual config (atomic on POSIX systems)
+    os.replace(temp_path, config_path)
+
+
+def _write_config_lines(config_path: str, lines: List[str]):
+    """Write the config file lines (to the batch's copy, if in a batch)"""
+    if _active_editor is not None:
+        _active_editor.lines = lines
+        _active_editor.modified = True
+        return
+    _atomic_write_lines(config_path, lines)
+
+
+def _find_profile_section(lines: List[str], profile_name: str) -> Tuple[int, int]:
+    """Find a profile section in config file lines
+
+    Args:
+        lines: Config file lines
+        profile_name: Name of the profile
+
+    Returns:
+        Tuple of (header line index, index just past the section), or
+        (-1, -1) if the section is not found
+    """
+    section_name = f"[profile:{profile_name}]"
+    section_start = -1
+
+    for i, line in enumerate(lines):
+        stripped = line.strip()
+        if stripped == section_name:
+            section_start = i
+        elif section_start >= 0 and stripped.startswith('[') and stripped.endswith(']'):
+            # Found next section
+            return section_start, i
+
+    if section_start < 0:
+        return -1, -1
+    return section_start, len(lines)  # Profile section goes to end of file
+
+
+def _replace_section_body(lines: List[str], section_start: int, section_end: int,
+                          body: List[str], blank_before_next: bool = True) -> List[str]:
+    """Splice a rebuilt section body back into the config file lines
+
+    Sections are rebuilt in one pass and spliced back once, rather than
+    edited with repeated inserts and deletes.
+
+    Args:
+        lines: Config file lines
+        section_start: Index of the section header
+        section_end: Index just past the section
+        body: New lines for the section (after the header)
+        blank_before_next: Ensure a blank line separates the section from
+            the next one
+
+    Returns:
+        New list of config file lines
+    """
+    if blank_before_next and section_end < len(lines):
+        next_line = lines[section_end].strip()
+        if next_line.startswith('[') and next_line.endswith(']'):
+            # Next line is a section header - ensure blank line before it
+            last_line = body[-1] if body else lines[section_start]
+            if last_line.strip() != '':
+                body.append("\n")
+    return lines[:section_start + 1] + body + lines[section_end:]
+
+
 def save_profile(profile: Profile, modifications: Dict[str, str]) -> bool:
     """Save profile modifications to config file (preserves comments and formatting)
 
@@ -186,112 +395,71 @@ def save_profile(profile: Profile, modifications: Dict[str, str]) -> bool:
 
     try:
         # Create backup first
-        backup_path = f"{config_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        shutil.copy2(config_path, backup_path)
-        logger.info(f"Created backup: {backup_path}")
+        backup_path = _backup_config(config_path)
 
         # Read file as lines to preserve comments and formatting
-        with open(config_path, 'r') as f:
-            lines = f.readlines()
+        lines = _read_config_lines(config_path)
 
         # Find the profile section
-        section_name = f"[profile:{profile.name}]"
-        section_start = -1
-        section_end = -1
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped == section_name:
-                section_start = i
-            elif section_start >= 0 and stripped.startswith('[') and stripped.endswith(']'):
-                # Found next section
-                section_end = i
-                break
+        section_start, section_end = _find_profile_section(lines, profile.name)
 
         if section_start < 0:
-            logger.error(f"Profile section {section_name} not found in config")
+            logger.error(f"Profile section [profile:{profile.name}] not found in config")
             return False
 
-        if section_end < 0:
-            section_end = len(lines)  # Profile section goes to end of file
+        # Index the first line of each control within the section
+        body = lines[section_start + 1:section_end]
+        key_lines = {}
+        for i, line in enumerate(body):
+            stripped = line.strip()
+
+            # Skip empty lines and comments
+            if not stripped or stripped.startswith('#'):
+                continue
+
+            if '=' in line:
+                key_lines.setdefault(line.split('=')[0].strip(), i)
 
         # Update only the modified controls within the section
+        added = []
+        insert_pos = None
         for control_name, action_str in modifications.items():
+            i = key_lines.get(control_name)
+
             # Skip controls set to "none" - we'll remove them from config
             if action_str.lower() == "none":
-                # Find and remove the control line if it exists
-                for i in range(section_start + 1, section_end):
-                    line = lines[i]
-                    stripped = line.strip()
-
-                    # Skip empty lines and comments
-                    if not stripped or stripped.startswith('#'):
-                        continue
-
-                    # Check if this line is for our control
-                    if '=' in line:
-                        key = line.split('=')[0].strip()
-                        if key == control_name:
-                            # Remove this line
-                            del lines[i]
-                            section_end -= 1  # Adjust section end since we deleted a line
-                            logger.debug(f"Removed {control_name} (set to none)")
-                            break
+                if i is not None:
+                    body[i] = None
+                    logger.debug(f"Removed {control_name} (set to none)")
                 # Don't add it if it doesn't exist
                 continue
 
-            # Find the control line within this section
-            found = False
-            for i in range(section_start + 1, section_end):
-                line = lines[i]
-                stripped = line.strip()
-
-                # Skip empty lines and comments
-                if not stripped or stripped.startswith('#'):
-                    continue
-
-                # Check if this line is for our control
-                if '=' in line:
-                    key = line.split('=')[0].strip()
-                    if key == control_name:
-                        # Preserve indentation
-                        indent = len(line) - len(line.lstrip())
-                        lines[i] = ' ' * indent + f"{control_name} = {action_str}\n"
-                        found = True
-                        logger.debug(f"Updated {control_name} = {action_str}")
-                        break
-
-            if not found:
-                # Control not found in section, add it before next section
-                # Find a good place to insert (after last control mapping)
-                insert_pos = section_end
-                for i in range(section_end - 1, section_start, -1):
-                    stripped = lines[i].strip()
-                    if stripped and not stripped.startswith('#') and '=' in stripped:
-                        insert_pos = i + 1
-                        break
-
-                # Add the new control mapping
-                lines.insert(insert_pos, f"{control_name} = {action_str}\n")
+            if i is not None:
+                # Preserve indentation
+                line = body[i]
+                indent = len(line) - len(line.lstrip())
+                body[i] = ' ' * indent + f"{control_name} = {action_str}\n"
+                logger.debug(f"Updated {control_name} = {action_str}")
+            else:
+                # Control not found in section, add it after the last
+                # control mapping (as of the first addition)
+                if insert_pos is None:
+                    insert_pos = len(body)
+                    for j in range(len(body) - 1, -1, -1):
+                        stripped = body[j].strip() if body[j] is not None else ''
+                        if stripped and not stripped.startswith('#') and '=' in stripped:
+                            insert_pos = j + 1
+                            break
+                added.append(f"{control_name} = {action_str}\n")
                 logger.debug(f"Added new control: {control_name} = {action_str}")
-                section_end += 1  # Adjust section end since we inserted a line
 
-        # Ensure there's a blank line before next section
-        if section_end < len(lines):
-            next_line = lines[section_end].strip()
-            if next_line.startswith('[') and next_line.endswith(']'):
-                # Next line is a section header - ensure blank line before it
-                if section_end > 0 and lines[section_end - 1].strip() != '':
-                    lines.insert(section_end, "\n")
-                    section_end += 1
+        if added:
+            body[insert_pos:insert_pos] = added
+        body = [line for line in body if line is not None]
 
-        # Write to temporary file first (atomic write)
-        temp_path = f"{config_path}.tmp"
-        with open(temp_path, 'w') as f:
-            f.writelines(lines)
+        lines = _replace_section_body(lines, section_start, section_end, body)
 
-        # Rename temp file to actual config (atomic on POSIX systems)
-        os.replace(temp_path, config_path)
+        _write_config_lines(config_path, lines)
 
         logger.info(f"Successfully saved profile: {profile.name}")
         return True
@@ -299,7 +467,7 @@ def save_profile(profile: Profile, modifications: Dict[str, str]) -> bool:
     except Exception as e:
         logger.error(f"Error saving profile: {e}", exc_info=True)
         # Try to restore from backup if save failed
-        if os.path.exists(backup_path):
+        if backup_path and os.path.exists(backup_path):
             try:
                 shutil.copy2(backup_path, config_path)
                 logger.info("Restored config from backup after error")
@@ -331,133 +499,76 @@ def save_modifier_config(profile: Profile) -> bool:
 
     try:
         # Create backup first
-        backup_path = f"{config_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        shutil.copy2(config_path, backup_path)
-        logger.info(f"Created backup: {backup_path}")
+        _backup_config(config_path)
 
         # Read file as lines to preserve comments and formatting
-        with open(config_path, 'r') as f:
-            lines = f.readlines()
+        lines = _read_config_lines(config_path)
 
         # Find the profile section
-        section_name = f"[profile:{profile.name}]"
-        section_start = -1
-        section_end = -1
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped == section_name:
-                section_start = i
-            elif section_start >= 0 and stripped.startswith('[') and stripped.endswith(']'):
-                section_end = i
-                break
+        section_start, section_end = _find_profile_section(lines, profile.name)
 
         if section_start < 0:
-            logger.error(f"Profile section {section_name} not found in config")
+            logger.error(f"Profile section [profile:{profile.name}] not found in config")
             return False
 
-        if section_end < 0:
-            section_end = len(lines)
-
-        # First pass: Remove old modifier declarations, base actions, combos,
-        # and regular mappings for buttons that are now modifiers
-        i = section_start + 1
-        while i < section_end:
-            line = lines[i]
+        # First pass: Drop old modifier declarations, base actions, combos,
+        # and regular mappings for buttons that are now modifiers, and
+        # collapse multiple consecutive blank lines within the section
+        body = []
+        for line in lines[section_start + 1:section_end]:
             stripped = line.strip()
 
-            # Skip empty lines and comments
-            if not stripped or stripped.startswith('#'):
-                i += 1
-                continue
-
-            if '=' in line:
+            if stripped and not stripped.startswith('#') and '=' in line:
                 key = line.split('=')[0].strip()
                 value = line.split('=', 1)[1].strip()
 
-                # Remove old modifier declarations
+                # Old modifier declarations
                 if value == 'modifier':
-                    del lines[i]
-                    section_end -= 1
                     continue
 
-                # Remove old base actions and combos (anything with a dot that's not a comment)
+                # Old base actions and combos (anything with a dot that's not a comment)
                 if '.' in key and not key.endswith('.comment'):
-                    del lines[i]
-                    section_end -= 1
                     continue
 
-                # Remove regular mappings for buttons that are now modifiers
+                # Regular mappings for buttons that are now modifiers
                 # (they'll use base_action instead)
                 if key in profile.modifier_buttons and '.' not in key:
-                    del lines[i]
-                    section_end -= 1
                     continue
 
-            i += 1
+            # If this line and the previous line are both blank, drop this one
+            if not stripped and body and body[-1].strip() == '':
+                continue
 
-        # Clean up multiple consecutive blank lines within the section
-        i = section_start + 1
-        while i < section_end:
-            # If this line and the previous line are both blank, remove this one
-            if i > section_start + 1 and lines[i].strip() == '' and lines[i - 1].strip() == '':
-                del lines[i]
-                section_end -= 1
-            else:
-                i += 1
+            body.append(line)
 
-        # Second pass: Add new modifier configuration
-        # Find insertion point (after regular mappings, before next section)
-        insert_pos = section_end
+        # Second pass: Add new modifier configuration after regular mappings
 
         # Add blank line before modifier section if we have modifiers and one doesn't already exist
         if profile.modifier_buttons or profile.modifier_base_actions or profile.modifier_mappings:
-            # Check if there's already a blank line before insert_pos
-            if insert_pos > 0 and lines[insert_pos - 1].strip() != '':
-                lines.insert(insert_pos, "\n")
-                insert_pos += 1
-                section_end += 1
+            last_line = body[-1] if body else lines[section_start]
+            if last_line.strip() != '':
+                body.append("\n")
 
         # Add modifier declarations
         for modifier_name in sorted(profile.modifier_buttons):
-            lines.insert(insert_pos, f"{modifier_name} = modifier\n")
+            body.append(f"{modifier_name} = modifier\n")
             logger.debug(f"Added modifier declaration: {modifier_name}")
-            insert_pos += 1
-            section_end += 1
 
         # Add base actions
         for modifier_name in sorted(profile.modifier_base_actions.keys()):
             action_str = profile.modifier_base_actions[modifier_name]
-            lines.insert(insert_pos, f"{modifier_name}.base_action = {action_str}\n")
+            body.append(f"{modifier_name}.base_action = {action_str}\n")
             logger.debug(f"Added base action: {modifier_name}.base_action = {action_str}")
-            insert_pos += 1
-            section_end += 1
 
         # Add combos (maintain insertion order - don't sort)
         for (modifier_name, control_name), action_str in profile.modifier_mappings.items():
-            lines.insert(insert_pos, f"{modifier_name}.{control_name} = {action_str}\n")
+            body.append(f"{modifier_name}.{control_name} = {action_str}\n")
             logger.debug(f"Added combo: {modifier_name}.{control_name} = {action_str}")
-            insert_pos += 1
-            section_end += 1
 
         # Ensure there's a blank line after modifier section before next section
-        # Check if section_end points to a section header (another profile)
-        if section_end < len(lines):
-            next_line = lines[section_end].strip()
-            if next_line.startswith('[') and next_line.endswith(']'):
-                # Next line is a section header - check if we need a blank line before it
-                # Only add if the previous line is not already blank
-                if section_end > 0 and lines[section_end - 1].strip() != '':
-                    lines.insert(section_end, "\n")
-                    section_end += 1
+        lines = _replace_section_body(lines, section_start, section_end, body)
 
-        # Write to temporary file first (atomic write)
-        temp_path = f"{config_path}.tmp"
-        with open(temp_path, 'w') as f:
-            f.writelines(lines)
-
-        # Rename temp file to actual config (atomic on POSIX systems)
-        os.replace(temp_path, config_path)
+        _write_config_lines(config_path, lines)
 
         logger.info(f"Successfully saved modifier config for profile: {profile.name}")
         return True
@@ -492,84 +603,45 @@ def save_mapping_comments(profile: Profile) -> bool:
 
     try:
         # Create backup first
-        backup_path = f"{config_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        shutil.copy2(config_path, backup_path)
-        logger.info(f"Created backup: {backup_path}")
+        _backup_config(config_path)
 
         # Read file as lines to preserve comments and formatting
-        with open(config_path, 'r') as f:
-            lines = f.readlines()
+        lines = _read_config_lines(config_path)
 
         # Find the profile section
-        section_name = f"[profile:{profile.name}]"
-        section_start = -1
-        section_end = -1
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped == section_name:
-                section_start = i
-            elif section_start >= 0 and stripped.startswith('[') and stripped.endswith(']'):
-                section_end = i
-                break
+        section_start, section_end = _find_profile_section(lines, profile.name)
 
         if section_start < 0:
-            logger.error(f"Profile section {section_name} not found in config")
+            logger.error(f"Profile section [profile:{profile.name}] not found in config")
             return False
 
-        if section_end < 0:
-            section_end = len(lines)
-
-        # First pass: Remove all old .comment lines
-        i = section_start + 1
-        while i < section_end:
-            line = lines[i]
-            if '=' in line:
-                key = line.split('=')[0].strip()
-                if key.endswith('.comment'):
-                    del lines[i]
-                    section_end -= 1
-                    continue
-            i += 1
+        # First pass: Drop all old .comment lines
+        body = [
+            line for line in lines[section_start + 1:section_end]
+            if '=' not in line or not line.split('=')[0].strip().endswith('.comment')
+        ]
 
-        # Second pass: Add new comments
-        insert_pos = section_end
+        # Second pass: Add new comments at the end of the section
 
         # Add regular mapping comments
         for control_name in sorted(profile.mapping_comments.keys()):
             comment_text = profile.mapping_comments[control_name]
             # Convert newlines to \n escape sequences for storage
             comment_text_escaped = comment_text.replace('\n', '\\n')
-            lines.insert(insert_pos, f"{control_name}.comment = {comment_text_escaped}\n")
+            body.append(f"{control_name}.comment = {comment_text_escaped}\n")
             logger.debug(f"Added comment: {control_name}.comment")
-            insert_pos += 1
-            section_end += 1
 
         # Add modifier combo comments (maintain insertion order - don't sort)
         for (modifier_name, control_name), comment_text in profile.modifier_combo_comments.items():
             # Convert newlines to \n escape sequences for storage
             comment_text_escaped = comment_text.replace('\n', '\\n')
-            lines.insert(insert_pos, f"{modifier_name}.{control_name}.comment = {comment_text_escaped}\n")
+            body.append(f"{modifier_name}.{control_name}.comment = {comment_text_escaped}\n")
             logger.debug(f"Added combo comment: {modifier_name}.{control_name}.comment")
-            insert_pos += 1
-            section_end += 1
 
         # Ensure there's a blank line before next section
-        if section_end < len(lines):
-            next_line = lines[section_end].strip()
-            if next_line.startswith('[') and next_line.endswith(']'):
-                # Next line is a section header - ensure blank line before it
-                if section_end > 0 and lines[section_end - 1].strip() != '':
-                    lines.insert(section_end, "\n")
-                    section_end += 1
+        lines = _replace_section_body(lines, section_start, section_end, body)
 
-        # Write to temporary file first (atomic write)
-        temp_path = f"{config_path}.tmp"
-        with open(temp_path, 'w') as f:
-            f.writelines(lines)
-
-        # Rename temp file to actual config (atomic on POSIX systems)
-        os.replace(temp_path, config_path)
+        _write_config_lines(config_path, lines)
 
         logger.info(f"Successfully saved comments for profile: {profile.name}")
         return True
@@ -604,118 +676,85 @@ def save_haptic_config(profile: Profile) -> bool:
 
     try:
         # Create backup first
-        backup_path = f"{config_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        shutil.copy2(config_path, backup_path)
-        logger.info(f"Created backup: {backup_path}")
+        _backup_config(config_path)
 
         # Read file as lines to preserve comments and formatting
-        with open(config_path, 'r') as f:
-            lines = f.readlines()
+        lines = _read_config_lines(config_path)
 
         # Find the profile section
-        section_name = f"[profile:{profile.name}]"
-        section_start = -1
-        section_end = -1
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped == section_name:
-                section_start = i
-            elif section_start >= 0 and stripped.startswith('[') and stripped.endswith(']'):
-                section_end = i
-                break
+        section_start, section_end = _find_profile_section(lines, profile.name)
 
         if section_start < 0:
-            logger.error(f"Profile section {section_name} not found in config")
+            logger.error(f"Profile section [profile:{profile.name}] not found in config")
             return False
 
-        if section_end < 0:
-            section_end = len(lines)
-
-        # First pass: Remove all old haptic lines (strength and speed, global and per-dial/per-combo)
-        i = section_start + 1
-        while i < section_end:
-            line = lines[i]
+        # First pass: Drop all old haptic lines (strength and speed, global and per-dial/per-combo)
+        body = []
+        for line in lines[section_start + 1:section_end]:
             if '=' in line:
                 key = line.split('=')[0].strip()
-                # Remove global and per-dial/per-combo haptic strength and speed settings
                 if (key == 'haptic' or key == 'haptic_speed' or
                     key.startswith('haptic.') or key.startswith('haptic_speed.')):
-                    del lines[i]
-                    section_end -= 1
                     continue
-            i += 1
+            body.append(line)
 
-        # Second pass: Add new haptic configuration
-        # Find insertion point (after section header and matchers, before mappings)
-        insert_pos = section_start + 1
-
-        # Skip over window matching fields (app_id, window_class, etc.)
-        while insert_pos < section_end:
-            line = lines[insert_pos].strip()
-            if not line or line.startswith('#'):
-                insert_pos += 1
-                continue
-            if '=' in line:
-                key = line.split('=')[0].strip()
-                if key in ('app_id', 'window_class', 'window_title'):
-                    insert_pos += 1
-                    continue
-            break
+        # Second pass: Build new haptic configuration
+        haptic_lines = []
 
         # Add global haptic setting if set (Phase 1)
         if profile.haptic_config.global_setting is not None:
             haptic_value = str(profile.haptic_config.global_setting)
-            lines.insert(insert_pos, f"haptic = {haptic_value}\n")
+            haptic_lines.append(f"haptic = {haptic_value}\n")
             logger.debug(f"Added haptic = {haptic_value}")
-            insert_pos += 1
-            section_end += 1
 
         # Add global haptic speed if set (Phase 1)
         if profile.haptic_config.global_speed is not None:
             speed_value = str(profile.haptic_config.global_speed)
-            lines.insert(insert_pos, f"haptic_speed = {speed_value}\n")
+            haptic_lines.append(f"haptic_speed = {speed_value}\n")
             logger.debug(f"Added haptic_speed = {speed_value}")
-            insert_pos += 1
-            section_end += 1
 
         # Add per-dial strength settings
         for dial, strength in profile.haptic_config.dial_settings.items():
-            lines.insert(insert_pos, f"haptic.{dial} = {strength}\n")
+            haptic_lines.append(f"haptic.{dial} = {strength}\n")
             logger.debug(f"Added haptic.{dial} = {strength}")
-            insert_pos += 1
-            section_end += 1
 
         # Add per-dial speed settings
         for dial, speed in profile.haptic_config.dial_speed_settings.items():
-            lines.insert(insert_pos, f"haptic_speed.{dial} = {speed}\n")
+            haptic_lines.append(f"haptic_speed.{dial} = {speed}\n")
             logger.debug(f"Added haptic_speed.{dial} = {speed}")
-            insert_pos += 1
-            section_end += 1
 
         # Add per-combo strength settings
         for (dial, modifier), strength in profile.haptic_config.combo_settings.items():
             if modifier:
-                lines.insert(insert_pos, f"haptic.{dial}.{modifier} = {strength}\n")
+                haptic_lines.append(f"haptic.{dial}.{modifier} = {strength}\n")
                 logger.debug(f"Added haptic.{dial}.{modifier} = {strength}")
-                insert_pos += 1
-                section_end += 1
 
         # Add per-combo speed settings
         for (dial, modifier), speed in profile.haptic_config.combo_speed_settings.items():
             if modifier:
-                lines.insert(insert_pos, f"haptic_speed.{dial}.{modifier} = {speed}\n")
+                haptic_lines.append(f"haptic_speed.{dial}.{modifier} = {speed}\n")
                 logger.debug(f"Added haptic_speed.{dial}.{modifier} = {speed}")
+
+        # Find insertion point (after section header and matchers, before mappings)
+        # by skipping over window matching fields (app_id, window_class, etc.)
+        insert_pos = 0
+        while insert_pos < len(body):
+            line = body[insert_pos].strip()
+            if not line or line.startswith('#'):
                 insert_pos += 1
-                section_end += 1
+                continue
+            if '=' in line:
+                key = line.split('=')[0].strip()
+                if key in ('app_id', 'window_class', 'window_title'):
+                    insert_pos += 1
+                    continue
+            break
+        body[insert_pos:insert_pos] = haptic_lines
 
-        # Write to temporary file first (atomic write)
-        temp_path = f"{config_path}.tmp"
-        with open(temp_path, 'w') as f:
-            f.writelines(lines)
+        lines = _replace_section_body(lines, section_start, section_end, body,
+                                      blank_before_next=False)
 
-        # Rename temp file to actual config (atomic on POSIX systems)
-        os.replace(temp_path, config_path)
+        _write_config_lines(config_path, lines)
 
         logger.info(f"Successfully saved haptic config for profile: {profile.name}")
         return True
@@ -756,13 +795,10 @@ def save_profile_metadata(profile: Profile, old_name: Optional[str] = None) -> b
 
     try:
         # Create backup first
-        backup_path = f"{config_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        shutil.copy2(config_path, backup_path)
-        logger.info(f"Created backup: {backup_path}")
+        backup_path = _backup_config(config_path)
 
         # Read file as lines to preserve comments and formatting
-        with open(config_path, 'r') as f:
-            lines = f.readlines()
+        lines = _read_config_lines(config_path)
 
         # Find the profile section (use old_name if renaming)
         search_name = old_name if old_name else profile.name
@@ -860,13 +896,7 @@ def save_profile_metadata(profile: Profile, old_name: Optional[str] = None) -> b
         adjustment += update_or_add_field('window_class', profile.window_class,
                                           window_class_line + adjustment if window_class_line >= 0 else -1)
 
-        # Write to temporary file first (atomic write)
-        temp_path = f"{config_path}.tmp"
-        with open(temp_path, 'w') as f:
-            f.writelines(lines)
-
-        # Rename temp file to actual config (atomic on POSIX systems)
-        os.replace(temp_path, config_path)
+        _write_config_lines(config_path, lines)
 
         logger.info(f"Successfully saved profile metadata: {profile.name}")
         return True
@@ -874,7 +904,7 @@ def save_profile_metadata(profile: Profile, old_name: Optional[str] = None) -> b
     except Exception as e:
         logger.error(f"Error saving profile metadata: {e}", exc_info=True)
         # Try to restore from backup if save failed
-        if os.path.exists(backup_path):
+        if backup_path and os.path.exists(backup_path):
             try:
                 shutil.copy2(backup_path, config_path)
                 logger.info("Restored config from backup after error")
@@ -18,7 +18,8 @@ from .driver_manager import DriverManager
 from .control_editor import ControlEditor, ROTARY_TO_DIAL
 from .config_writer import (save_profile, save_profile_metadata, create_new_profile,
                             profile_exists_in_config, cleanup_old_backups,
-                            save_modifier_config, save_mapping_comments, save_haptic_config)
+                            save_modifier_config, save_mapping_comments, save_haptic_config,
+                            batch_config_saves)
 
 # Import from existing driver code
 from tuxbox.config_loader import load_profiles
@@ -304,19 +305,21 @@ class TuxBoxConfigWindow(QMainWindow):
                     # Determine if profile was renamed
                     old_name = original_name if original_name != self.current_profile.name else None
 
-                    metadata_success = save_profile_metadata(self.current_profile, old_name)
-                    # Update the original name tracker if profile was renamed
-                    if old_name and metadata_success:
-                        self.profile_original_names[id(self.current_profile)] = self.current_profile.name
+                    # Legacy config: read, back up and write the file once for all saves
+                    with batch_config_saves() as batch:
+                        metadata_success = save_profile_metadata(self.current_profile, old_name)
+                        # Update the original name tracker if profile was renamed
+                        if old_name and metadata_success:
+                            self.profile_original_names[id(self.current_profile)] = self.current_profile.name
 
-                    mappings_success = True
-                    if self.modified_mappings:
-                        mappings_success = save_profile(self.current_profile, self.modified_mappings)
+                        mappings_success = True
+                        if self.modified_mappings:
+                            mappings_success = save_profile(self.current_profile, self.modified_mappings)
 
-                    # Save haptic config
-                    haptic_success = save_haptic_config(self.current_profile)
+                        # Save haptic config
+                        haptic_success = save_haptic_config(self.current_profile)
 
-                    success = metadata_success and mappings_success and haptic_success
+                    success = metadata_success and mappings_success and haptic_success and batch.success
 
                 if not success:
                     QMessageBox.critical(
@@ -968,49 +971,52 @@ class TuxBoxConfigWindow(QMainWindow):
             # Determine if profile was renamed
             old_name = original_name if original_name != self.current_profile.name else None
 
-            # Save profile metadata first (name, window matching)
-            metadata_success = save_profile_metadata(self.current_profile, old_name)
-            if not metadata_success:
-                self.statusBar().showMessage("Failed to save profile metadata")
-                QMessageBox.critical(
-                    self,
-                    "Save Failed",
-                    f"Failed to save profile metadata for '{self.current_profile.name}'.\n\n"
-                    "Check the logs for details."
-                )
-                return
+            # Legacy config: read, back up and write the file once for all saves
+            with batch_config_saves() as batch:
+                # Save profile metadata first (name, window matching)
+                metadata_success = save_profile_metadata(self.current_profile, old_name)
+                if not metadata_success:
+                    self.statusBar().showMessage("Failed to save profile metadata")
+                    QMessageBox.critical(
+                        self,
+                        "Save Failed",
+                        f"Failed to save profile metadata for '{self.current_profile.name}'.\n\n"
+                        "Check the logs for details."
+                    )
+                    return
 
-            # Update the original name tracker if profile was renamed
-            if old_name:
-                self.profile_original_names[id(self.current_profile)] = self.current_profile.name
-
-            # Save modifier config FIRST (before regular mappings)
-            # This ensures modifiers are properly configured before writing regular mappings
-            modifiers_success = True
-            if self.modified_modifiers:
-                modifiers_success = save_modifier_config(self.current_profile)
-
-            # Save the control mappings if any were modified
-            # Filter out buttons that are modifiers (they use base_action instead)
-            mappings_success = True
-            if self.modified_mappings:
-                # Remove any modifier buttons from mappings to avoid conflicts
-                filtered_mappings = {
-                    ctrl: action for ctrl, action in self.modified_mappings.items()
-                    if ctrl not in self.current_profile.modifier_buttons
-                }
-                if filtered_mappings:
-                    mappings_success = save_profile(self.current_profile, filtered_mappings)
-
-            # Save comments if any were modified
-            comments_success = True
-            if self.modified_comments:
-                comments_success = save_mapping_comments(self.current_profile)
-
-            # Save haptic config (always save since it's edited via profile settings)
-            haptic_success = save_haptic_config(self.current_profile)
-
-            success = metadata_success and mappings_success and comments_success and modifiers_success and haptic_success
+                # Update the original name tracker if profile was renamed
+                if old_name:
+                    self.profile_original_names[id(self.current_profile)] = self.current_profile.name
+
+                # Save modifier config FIRST (before regular mappings)
+                # This ensures modifiers are properly configured before writing regular mappings
+                modifiers_success = True
+                if self.modified_modifiers:
+                    modifiers_success = save_modifier_config(self.current_profile)
+
+                # Save the control mappings if any were modified
+                # Filter out buttons that are modifiers (they use base_action instead)
+                mappings_success = True
+                if self.modified_mappings:
+                    # Remove any modifier buttons from mappings to avoid conflicts
+                    filtered_mappings = {
+                        ctrl: action for ctrl, action in self.modified_mappings.items()
+                        if ctrl not in self.current_profile.modifier_buttons
+                    }
+                    if filtered_mappings:
+                        mappings_success = save_profile(self.current_profile, filtered_mappings)
+
+                # Save comments if any were modified
+                comments_success = True
+                if self.modified_comments:
+                    comments_success = save_mapping_comments(self.current_profile)
+
+                # Save haptic config (always save since it's edited via profile settings)
+                haptic_success = save_haptic_config(self.current_profile)
+
+            success = (metadata_success and mappings_success and comments_success and modifiers_success
+                       and haptic_success and batch.success)
 
         if success:
             # Clear modified state
@@ -1572,34 +1578,37 @@ with full GUI configuration support.</p>
                     # Existing profile - save metadata and mappings
                     old_name = original_name if original_name != self.current_profile.name else None
 
-                    # Save profile metadata (name, window matching)
-                    metadata_success = save_profile_metadata(self.current_profile, old_name)
-
-                    # Save modifier config FIRST (before regular mappings)
-                    modifiers_success = True
-                    if self.modified_modifiers:
-                        modifiers_success = save_modifier_config(self.current_profile)
-
-                    # Save control mappings
-                    mappings_success = True
-                    if self.modified_mappings:
-                        # Remove any modifier buttons from mappings to avoid conflicts
-                        filtered_mappings = {
-                            ctrl: action for ctrl, action in self.modified_mappings.items()
-                            if ctrl not in self.current_profile.modifier_buttons
-                        }
-                        if filtered_mappings:
-                            mappings_success = save_profile(self.current_profile, filtered_mappings)
-
-                    # Save comments if any were modified
-                    comments_success = True
-                    if self.modified_comments:
-                        comments_success = save_mapping_comments(self.current_profile)
-
-                    # Save haptic config
-                    haptic_success = save_haptic_config(self.current_profile)
-
-                    success = metadata_success and modifiers_success and mappings_success and comments_success and haptic_success
+                    # Legacy config: read, back up and write the file once for all saves
+                    with batch_config_saves() as batch:
+                        # Save profile metadata (name, window matching)
+                        metadata_success = save_profile_metadata(self.current_profile, old_name)
+
+                        # Save modifier config FIRST (before regular mappings)
+                        modifiers_success = True
+                        if self.modified_modifiers:
+                            modifiers_success = save_modifier_config(self.current_profile)
+
+                        # Save control mappings
+                        mappings_success = True
+                        if self.modified_mappings:
+                            # Remove any modifier buttons from mappings to avoid conflicts
+                            filtered_mappings = {
+                                ctrl: action for ctrl, action in self.modified_mappings.items()
+                                if ctrl not in self.current_profile.modifier_buttons
+                            }
+                            if filtered_mappings:
+                                mappings_success = save_profile(self.current_profile, filtered_mappings)
+
+                        # Save comments if any were modified
+                        comments_success = True
+                        if self.modified_comments:
+                            comments_success = save_mapping_comments(self.current_profile)
+
+                        # Save haptic config
+                        haptic_success = save_haptic_config(self.current_profile)
+
+                    success = (metadata_success and modifiers_success and mappings_success and comments_success
+                               and haptic_success and batch.success)
 
                 if not success:
                     reply2 = QMessageBox.critical(
@@ -9,6 +9,7 @@ at specific byte offsets. This module builds that message dynamically based on
 user configuration.
 """
 
+import functools
 import logging
 from enum import Enum
 from dataclasses import dataclass, field
@@ -28,9 +29,12 @@ class HapticStrength(Enum):
     STRONG = 0x08
 
     @classmethod
+    @functools.lru_cache(maxsize=16)
     def from_string(cls, s: str) -> 'HapticStrength':
         """Parse from config string
 
+        Memoized - profiles only use a handful of distinct values.
+
         Args:
             s: String like 'off', 'weak', 'strong', or numeric '0', '1', '2'
 
@@ -39,12 +43,7 @@ class HapticStrength(Enum):
         """
         if s is None:
             return cls.OFF
-        mapping = {
-            'off': cls.OFF, 'none': cls.OFF, '0': cls.OFF, 'disabled': cls.OFF,
-            'weak': cls.WEAK, 'light': cls.WEAK, 'low': cls.WEAK, '1': cls.WEAK,
-            'strong': cls.STRONG, 'heavy': cls.STRONG, 'high': cls.STRONG, '2': cls.STRONG,
-        }
-        return mapping.get(s.lower().strip(), cls.OFF)
+        return _STRENGTH_NAMES.get(s.lower().strip(), cls.OFF)
 
     def __str__(self) -> str:
         return self.name.lower()
@@ -63,9 +62,12 @@ class HapticSpeed(Enum):
     SLOW = 0x02    # Fewer detents, coarser control
 
     @classmethod
+    @functools.lru_cache(maxsize=16)
     def from_string(cls, s: str) -> 'HapticSpeed':
         """Parse from config string
 
+        Memoized - profiles only use a handful of distinct values.
+
         Args:
             s: String like 'slow', 'medium', 'fast', or numeric '0', '1', '2'
 
@@ -74,17 +76,30 @@ class HapticSpeed(Enum):
         """
         if s is None:
             return cls.FAST
-        mapping = {
-            'fast': cls.FAST, 'high': cls.FAST, '0': cls.FAST,
-            'medium': cls.MEDIUM, 'med': cls.MEDIUM, 'normal': cls.MEDIUM, '1': cls.MEDIUM,
-            'slow': cls.SLOW, 'low': cls.SLOW, '2': cls.SLOW,
-        }
-        return mapping.get(s.lower().strip(), cls.FAST)
+        return _SPEED_NAMES.get(s.lower().strip(), cls.FAST)
 
     def __str__(self) -> str:
         return self.name.lower()
 
 
+# Config strings accepted by HapticStrength.from_string / HapticSpeed.from_string
+_STRENGTH_NAMES: Dict[str, HapticStrength] = {
+    'off': HapticStrength.OFF, 'none': HapticStrength.OFF, '0': HapticStrength.OFF,
+    'disabled': HapticStrength.OFF,
+    'weak': HapticStrength.WEAK, 'light': HapticStrength.WEAK, 'low': HapticStrength.WEAK,
+    '1': HapticStrength.WEAK,
+    'strong': HapticStrength.STRONG, 'heavy': HapticStrength.STRONG, 'high': HapticStrength.STRONG,
+    '2': HapticStrength.STRONG,
+}
+
+_SPEED_NAMES: Dict[str, HapticSpeed] = {
+    'fast': HapticSpeed.FAST, 'high': HapticSpeed.FAST, '0': HapticSpeed.FAST,
+    'medium': HapticSpeed.MEDIUM, 'med': HapticSpeed.MEDIUM, 'normal': HapticSpeed.MEDIUM,
+    '1': HapticSpeed.MEDIUM,
+    'slow': HapticSpeed.SLOW, 'low': HapticSpeed.SLOW, '2': HapticSpeed.SLOW,
+}
+
+
 # Rotary controls that have haptic feedback
 HAPTIC_DIALS = ['knob', 'scroll', 'dial']
 
@@ -165,6 +180,14 @@ _CONFIG_MESSAGE_TEMPLATE = bytes.fromhex(
     "0053005400a800a900aa00ab00fe"
 )
 
+# HAPTIC_BYTE_OFFSETS as (dial, modifier, offset), limited to offsets inside
+# the template, so build_config_message needs no per-entry bounds check
+_HAPTIC_OFFSETS = tuple(
+    (dial, modifier, offset)
+    for (dial, modifier), offset in HAPTIC_BYTE_OFFSETS.items()
+    if offset < len(_CONFIG_MESSAGE_TEMPLATE)
+)
+
 
 @dataclass
 class HapticConfig:
@@ -356,22 +379,25 @@ def build_config_message(haptic_config: Optional[HapticConfig] = None) -> bytes:
         - Combined: strength | speed (e.g., STRONG+SLOW = 0x08 | 0x02 = 0x0A)
     """
     if haptic_config is None:
-        haptic_config = HapticConfig.default_off()
+        return _DEFAULT_CONFIG_MESSAGE
 
     # Start with template
     msg = bytearray(_CONFIG_MESSAGE_TEMPLATE)
 
     # Apply haptic values at known offsets
-    for (dial, modifier), offset in HAPTIC_BYTE_OFFSETS.items():
-        if offset < len(msg):
-            strength = haptic_config.get_strength(dial, modifier)
-            speed = haptic_config.get_speed(dial, modifier)
-            # Combine strength (bits 2-3) and speed (bits 0-1)
-            msg[offset] = strength.value | speed.value
+    get_strength, get_speed = haptic_config.get_strength, haptic_config.get_speed
+    for dial, modifier, offset in _HAPTIC_OFFSETS:
+        # Combine strength (bits 2-3) and speed (bits 0-1)
+        msg[offset] = get_strength(dial, modifier).value | get_speed(dial, modifier).value
 
     return bytes(msg)
 
 
+# Message for profiles without haptic settings (all off), built once since
+# every such profile switch sends the same bytes
+_DEFAULT_CONFIG_MESSAGE = build_config_message(HapticConfig.default_off())
+
+
 def build_config_commands(haptic_config: Optional[HapticConfig] = None) -> List[bytes]:
     """Build list of config command packets for BLE transmission
 
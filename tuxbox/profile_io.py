@@ -7,16 +7,75 @@ Handles reading/writing individual .profile files and migration from legacy form
 import os
 import re
 import configparser
+import functools
 import logging
 import shutil
+import stat
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime
 
 from .haptic import HapticConfig, HapticStrength, HapticSpeed
+# config_loader only imports profile_io lazily (inside load_profiles), so a
+# module-level import here is not circular
+from .config_loader import (
+    Profile, BUTTON_CODES, parse_action, create_button_mapping,
+    get_capabilities_from_mapping, INVALID_MODIFIER_CONTROLS,
+    load_profiles_from_legacy_file, load_default_profiles, load_device_config
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-thread ConfigParser reused across profile loads (see _get_parser)
+_parser_local = threading.local()
+
+# Directories already created or found by this process (see _ensure_dir)
+_ensured_dirs: Set[Path] = set()
+
+
+# Patterns for the quick structural check in validate_profile_file
+_PROFILE_HEADER_RE = re.compile(rb'^[ \t]*\[profile\][ \t]*\r?$', re.M)
+_SECTION_HEADER_RE = re.compile(rb'^[ \t]*\[', re.M)
+_NAME_LINE_RE = re.compile(rb'^name[ \t]*=[ \t]*([^\r\n]*?)[ \t]*\r?$', re.M)
+_INVALID_NAME_CHARS_RE = re.compile(rb'[:\[\]#]')
+
+
+def _get_parser() -> configparser.ConfigParser:
+    """Get this thread's cleared ConfigParser for reading a profile file
+
+    Bulk loads parse many small files, so one parser per thread is reused
+    instead of constructing a new one each time. The returned parser is
+    only valid until the next call from the same thread.
+
+    Returns:
+        Empty ConfigParser configured for .profile files
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
+        _parser_local.parser = parser
+    else:
+        parser.clear()
+        parser[parser.default_section].clear()
+    return parser
+
+
+def _ensure_dir(path: Path):
+    """Create a directory (and parents) unless this process already did
+
+    Only for paths that are written through save_profile_to_file, which
+    recreates the directory if it was removed after being ensured.
+
+    Args:
+        path: Directory to create
+    """
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
 
 def _migrate_config_dir_if_needed():
     """Migrate config directory from ~/.config/tourbox/ to ~/.config/tuxbox/
@@ -194,17 +253,15 @@ def is_legacy_config() -> bool:
     config_dir = get_config_dir()
     legacy_path = config_dir / 'mappings.conf'
 
-    if not legacy_path.exists():
-        return False
-
+    # Scan line by line for a [profile:*] header instead of parsing the
+    # whole INI file - the marker is normally within the first few lines
     try:
-        config = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
-        config.read(str(legacy_path))
-
-        # Legacy format has [profile:*] sections
-        for section in config.sections():
-            if section.startswith('profile:'):
-                return True
+        with open(legacy_path, 'rb') as f:
+            for line in f:
+                if line.lstrip().startswith(b'[profile:'):
+                    return True
+    except FileNotFoundError:
+        return False
     except Exception as e:
         logger.error(f"Error checking legacy config: {e}")
 
@@ -246,20 +303,18 @@ def discover_profiles() -> List[Path]:
         if f.is_file() and f.suffix == '.profile':
             profiles.append(f)
 
-    # Sort alphabetically, but put 'default' first
-    def sort_key(p):
-        if p.stem == 'default':
-            return ('', p.stem)
-        return ('z', p.stem)
+    # Sort alphabetically, but put 'default' first (False sorts before True)
+    return sorted(profiles, key=lambda p: (p.stem != 'default', p.stem))
 
-    return sorted(profiles, key=sort_key)
 
-
-def validate_profile_file(filepath: Path) -> Tuple[bool, str]:
+def validate_profile_file(filepath: Path, full: bool = False) -> Tuple[bool, str]:
     """Validate a .profile file
 
     Args:
         filepath: Path to the .profile file
+        full: Always run the full configparser check, which rejects malformed
+            INI and warns about unknown buttons. Without it, a plainly
+            written profile is accepted after a quick structural check.
 
     Returns:
         Tuple of (is_valid, error_message)
@@ -270,8 +325,18 @@ def validate_profile_file(filepath: Path) -> Tuple[bool, str]:
     if not filepath.suffix == '.profile':
         return False, "File must have .profile extension"
 
+    # Fast path: a plainly written [profile] section with a usable name is
+    # valid without running configparser. Anything unusual falls through to
+    # the full parse below, which also produces the diagnostic messages.
+    if not full:
+        try:
+            if _is_plain_valid_profile(filepath.read_bytes()):
+                return True, ""
+        except OSError:
+            pass
+
     try:
-        config = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
+        config = _get_parser()
         config.read(str(filepath))
 
         # Must have [profile] section
@@ -292,7 +357,6 @@ def validate_profile_file(filepath: Path) -> Tuple[bool, str]:
 
         # Validate mappings if present
         if 'mappings' in config.sections():
-            from .config_loader import BUTTON_CODES
             for key in config['mappings'].keys():
                 # Skip known special keys
                 if key == 'modifier':
@@ -324,6 +388,33 @@ def validate_profile_file(filepath: Path) -> Tuple[bool, str]:
         return False, f"Error reading file: {e}"
 
 
+def _is_plain_valid_profile(data: bytes) -> bool:
+    """Check raw profile bytes for a [profile] section with a valid name
+
+    Only recognizes the simple layout written by save_profile_to_file, so a
+    False result means "needs a full parse", not "invalid".
+
+    Args:
+        data: Raw contents of the .profile file
+
+    Returns:
+        True if the [profile] section has a non-empty, valid name
+    """
+    header = _PROFILE_HEADER_RE.search(data)
+    if not header or _PROFILE_HEADER_RE.search(data, header.end()):
+        return False
+
+    # Limit the name search to the [profile] section
+    next_section = _SECTION_HEADER_RE.search(data, header.end())
+    end = next_section.start() if next_section else len(data)
+
+    name = _NAME_LINE_RE.search(data, header.end(), end)
+    if not name or not name.group(1):
+        return False
+
+    return not _INVALID_NAME_CHARS_RE.search(name.group(1))
+
+
 def load_profile_from_file(filepath: Path):
     """Load a single profile from a .profile file
 
@@ -333,20 +424,13 @@ def load_profile_from_file(filepath: Path):
     Returns:
         Profile object or None if failed
     """
-    from .config_loader import (
-        Profile, BUTTON_CODES, parse_action, create_button_mapping,
-        get_capabilities_from_mapping, VALID_MODIFIER_BUTTONS,
-        INVALID_MODIFIER_CONTROLS
-    )
-    from evdev import ecodes as e
-
     is_valid, error = validate_profile_file(filepath)
     if not is_valid:
         logger.error(f"Invalid profile file {filepath}: {error}")
         return None
 
     try:
-        config = configparser.ConfigParser(inline_comment_prefixes=('#',), interpolation=None)
+        config = _get_parser()
         config.read(str(filepath))
 
         # Get profile metadata
@@ -383,7 +467,9 @@ def load_profile_from_file(filepath: Path):
             haptic_config.global_speed = HapticSpeed.from_string(profile_section['haptic_speed'])
 
         # Parse mappings from [mappings] section
-        mapping = {}
+        # Built with int button codes and converted to the bytes-keyed
+        # Profile.mapping format once, after the loop
+        int_mapping = {}
         double_press_actions = {}
         on_release_controls = set()
         on_release_user_disabled = set()
@@ -415,19 +501,20 @@ def load_profile_from_file(filepath: Path):
 
                 if key in BUTTON_CODES:
                     codes = BUTTON_CODES[key]
-                    is_rotary = key in ('scroll_up', 'scroll_down', 'knob_cw', 'knob_ccw', 'dial_cw', 'dial_ccw')
+                    is_rotary = key in INVALID_MODIFIER_CONTROLS
 
                     if len(codes) == 2:
                         press_code, release_code = codes
                         press_events, release_events = create_button_mapping(action)
 
                         if is_rotary:
-                            mapping[bytes([press_code])] = press_events + release_events
-                            mapping[bytes([release_code])] = release_events
+                            int_mapping[press_code] = press_events + release_events
+                            int_mapping[release_code] = release_events
                         else:
-                            mapping[bytes([press_code])] = press_events
-                            mapping[bytes([release_code])] = release_events
+                            int_mapping[press_code] = press_events
+                            int_mapping[release_code] = release_events
 
+        mapping = {bytes([code]): events for code, events in int_mapping.items()}
         caps = get_capabilities_from_mapping(mapping)
 
         # Parse modifiers from [modifiers] section
@@ -436,60 +523,49 @@ def load_profile_from_file(filepath: Path):
         modifier_base_actions = {}
 
         if 'modifiers' in config.sections():
-            # First pass: find modifier declarations
+            # Single pass over the section: collect modifier declarations and
+            # stash the (already split) dotted keys for base actions and combos,
+            # which can only be resolved once all modifiers are known
+            deferred = []
             for key, value in config['modifiers'].items():
-                if value.strip() == 'modifier':
+                value = value.strip()
+                if value == 'modifier':
                     control_name = key.strip()
                     if control_name in INVALID_MODIFIER_CONTROLS:
                         logger.error(f"Invalid modifier: {control_name} cannot be a modifier")
                         continue
                     modifier_buttons.add(control_name)
-
-            # Second pass: parse base actions and combos
-            for key, value in config['modifiers'].items():
-                if '.base_action' in key:
+                elif '.' in key:
                     parts = key.split('.')
                     if len(parts) == 2:
-                        modifier_name = parts[0].strip()
-                        if modifier_name in modifier_buttons:
-                            modifier_base_actions[modifier_name] = value.strip()
+                        deferred.append((key, value, parts))
 
-                elif '.' in key and value.strip() != 'modifier':
-                    parts = key.split('.')
-                    if len(parts) == 2:
-                        modifier_name, control_name = parts[0].strip(), parts[1].strip()
-                        if modifier_name in modifier_buttons and control_name != 'base_action':
-                            modifier_mappings[(modifier_name, control_name)] = value.strip()
-
-        # Add modifier actions to capabilities
-        for action_str in list(modifier_mappings.values()) + list(modifier_base_actions.values()):
-            events = parse_action(action_str)
-            for event_type, event_code, value in events:
-                if event_type == e.EV_KEY:
-                    if e.EV_KEY not in caps:
-                        caps[e.EV_KEY] = []
-                    if event_code not in caps[e.EV_KEY]:
-                        caps[e.EV_KEY].append(event_code)
-                elif event_type == e.EV_REL:
-                    if e.EV_REL not in caps:
-                        caps[e.EV_REL] = []
-                    if event_code not in caps[e.EV_REL]:
-                        caps[e.EV_REL].append(event_code)
-
-        # Add double-press actions to capabilities
-        for action_str in double_press_actions.values():
-            events = parse_action(action_str)
-            for event_type, event_code, value in events:
-                if event_type == e.EV_KEY:
-                    if e.EV_KEY not in caps:
-                        caps[e.EV_KEY] = []
-                    if event_code not in caps[e.EV_KEY]:
-                        caps[e.EV_KEY].append(event_code)
-                elif event_type == e.EV_REL:
-                    if e.EV_REL not in caps:
-                        caps[e.EV_REL] = []
-                    if event_code not in caps[e.EV_REL]:
-                        caps[e.EV_REL].append(event_code)
+            # Resolve base actions and combos against the declared modifiers
+            for key, value, parts in deferred:
+                modifier_name = parts[0].strip()
+                if modifier_name not in modifier_buttons:
+                    continue
+
+                if '.base_action' in key:
+                    modifier_base_actions[modifier_name] = value
+                else:
+                    control_name = parts[1].strip()
+                    if control_name != 'base_action':
+                        modifier_mappings[(modifier_name, control_name)] = value
+
+        # Add modifier and double-press actions to capabilities
+        # (accumulate in sets, convert back to lists once at the end)
+        caps_sets = defaultdict(set, {event_type: set(codes) for event_type, codes in caps.items()})
+        extra_actions = (list(modifier_mappings.values()) +
+                         list(modifier_base_actions.values()) +
+                         list(double_press_actions.values()))
+        for action_str in extra_actions:
+            for event_type, event_code, value in parse_action(action_str):
+                caps_sets[event_type].add(event_code)
+
+        for event_type, codes in caps_sets.items():
+            if codes:
+                caps[event_type] = list(codes)
 
         # Parse haptic settings from [haptic] section
         if 'haptic' in config.sections():
@@ -568,21 +644,22 @@ def load_profile_from_file(filepath: Path):
         return None
 
 
-def save_profile_to_file(profile, filepath: Path) -> bool:
+def save_profile_to_file(profile, filepath: Path, dir_fd: Optional[int] = None) -> bool:
     """Save a profile to a .profile file
 
     Args:
         profile: Profile object to save
         filepath: Path to save to
+        dir_fd: Open descriptor of the file's directory, used for batched saves.
+            When given, the file is not fsynced on its own - the caller
+            fsyncs the directory once after the whole batch.
 
     Returns:
         True if successful
     """
-    from .config_loader import BUTTON_CODES
-
     try:
         # Ensure parent directory exists
-        filepath.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(filepath.parent)
 
         lines = []
 
@@ -719,10 +796,34 @@ def save_profile_to_file(profile, filepath: Path) -> bool:
 
         # Write atomically
         temp_path = filepath.with_suffix('.tmp')
-        with open(temp_path, 'w') as f:
-            f.write('\n'.join(lines))
+        if dir_fd is None:
+            try:
+                f = open(temp_path, 'w')
+            except FileNotFoundError:
+                # Directory was removed since it was ensured - create it again
+                _ensured_dirs.discard(filepath.parent)
+                _ensure_dir(filepath.parent)
+                f = open(temp_path, 'w')
+
+            with f:
+                f.write('\n'.join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(str(temp_path), str(filepath))
+        else:
+            # Batched save: resolve names relative to the shared directory
+            # descriptor and leave the directory fsync to the caller. The file
+            # data is still synced so the rename never exposes an empty file.
+            def opener(path, flags):
+                return os.open(path, flags, 0o666, dir_fd=dir_fd)
 
-        os.replace(str(temp_path), str(filepath))
+            with open(temp_path.name, 'w', opener=opener) as f:
+                f.write('\n'.join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(temp_path.name, filepath.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
 
         logger.info(f"Saved profile to {filepath}")
         return True
@@ -744,7 +845,6 @@ def _get_action_strings_from_mapping(profile) -> Dict[str, str]:
     Returns:
         Dict mapping control name to action string
     """
-    from .config_loader import BUTTON_CODES
     from evdev import ecodes as e
 
     # Reverse lookup: press_code -> control_name
@@ -771,12 +871,11 @@ def _get_action_strings_from_mapping(profile) -> Dict[str, str]:
     if not profile.mapping:
         return action_strings
 
-    for byte_code, events in profile.mapping.items():
-        if len(byte_code) != 1:
-            continue
-
-        code = byte_code[0]
+    # Unwrap the single-byte keys to int codes up front
+    int_items = ((byte_code[0], events) for byte_code, events in profile.mapping.items()
+                 if len(byte_code) == 1)
 
+    for code, events in int_items:
         # Only process press codes (not release codes)
         if code not in code_to_control:
             continue
@@ -784,7 +883,7 @@ def _get_action_strings_from_mapping(profile) -> Dict[str, str]:
         control = code_to_control[code]
 
         # Check if this is a rotary (events include press+release)
-        is_rotary = control in ('scroll_up', 'scroll_down', 'knob_cw', 'knob_ccw', 'dial_cw', 'dial_ccw')
+        is_rotary = control in INVALID_MODIFIER_CONTROLS
 
         if not events:
             action_strings[control] = 'none'
@@ -806,6 +905,30 @@ def _get_action_strings_from_mapping(profile) -> Dict[str, str]:
     return action_strings
 
 
+def _path_kind(path: Path) -> Optional[str]:
+    """Classify a path with a single stat() call
+
+    Lets callers that need both "does it exist" and "what is it" avoid
+    issuing several pathlib queries for the same path. Nothing is cached.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        'file', 'dir', 'other', or None if the path does not exist
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    if stat.S_ISREG(st.st_mode):
+        return 'file'
+    if stat.S_ISDIR(st.st_mode):
+        return 'dir'
+    return 'other'
+
+
 def get_profile_filepath(profile_name: str) -> Path:
     """Get the file path for a profile
 
@@ -842,7 +965,8 @@ def import_profile_from_file(source: Path) -> Tuple[Optional['Profile'], str]:
     Returns:
         Tuple of (Profile or None, error_message)
     """
-    is_valid, error = validate_profile_file(source)
+    # Files from outside the profiles directory get the full check
+    is_valid, error = validate_profile_file(source, full=True)
     if not is_valid:
         return None, error
 
@@ -866,8 +990,6 @@ def migrate_legacy_config() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    from .config_loader import load_profiles_from_legacy_file, load_device_config
-
     config_dir = get_config_dir()
     legacy_path = config_dir / 'mappings.conf'
     profiles_dir = get_profiles_dir()
@@ -895,15 +1017,25 @@ def migrate_legacy_config() -> Tuple[bool, str]:
         logger.info(f"Created profiles directory: {profiles_dir}")
 
         # Step 4: Save each profile to individual file
+        # Share one directory descriptor across the batch and fsync it once at
+        # the end rather than once per profile. Each file's data is synced
+        # before its rename, and the legacy config is left in place until
+        # step 6, so a crash here leaves it loadable as before.
         migrated = 0
-        for profile in profiles:
-            filepath = get_profile_filepath(profile.name)
+        dir_fd = os.open(str(profiles_dir), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for profile in profiles:
+                filepath = get_profile_filepath(profile.name)
 
-            if save_profile_to_file(profile, filepath):
-                migrated += 1
-                logger.info(f"Migrated profile '{profile.name}' to {filepath}")
-            else:
-                logger.error(f"Failed to migrate profile '{profile.name}'")
+                if save_profile_to_file(profile, filepath, dir_fd=dir_fd):
+                    migrated += 1
+                    logger.info(f"Migrated profile '{profile.name}' to {filepath}")
+                else:
+                    logger.error(f"Failed to migrate profile '{profile.name}'")
+
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
         # Step 5: Create new config.conf with device settings only
         device_config = load_device_config(str(legacy_path))
@@ -1000,7 +1132,7 @@ def delete_profile_file(profile_name: str) -> bool:
     """
     filepath = get_profile_filepath(profile_name)
 
-    if not filepath.exists():
+    if _path_kind(filepath) is None:
         logger.warning(f"Profile file not found: {filepath}")
         return False
 
@@ -1026,11 +1158,11 @@ def rename_profile_file(old_name: str, new_name: str) -> bool:
     old_path = get_profile_filepath(old_name)
     new_path = get_profile_filepath(new_name)
 
-    if not old_path.exists():
+    if _path_kind(old_path) is None:
         logger.warning(f"Profile file not found: {old_path}")
         return False
 
-    if new_path.exists():
+    if _path_kind(new_path) is not None:
         logger.warning(f"Target profile file already exists: {new_path}")
         return False
 
@@ -1052,8 +1184,24 @@ def profile_exists(profile_name: str) -> bool:
     Returns:
         True if profile file exists
     """
-    filepath = get_profile_filepath(profile_name)
-    return filepath.exists()
+    return _path_kind(get_profile_filepath(profile_name)) == 'file'
+
+
+@functools.lru_cache(maxsize=4)
+def _load_default_profiles(path: str, mtime_ns: int) -> Dict[str, 'Profile']:
+    """Load profiles from a legacy-format defaults file, memoized
+
+    The cache key includes the file's mtime so an edited file is re-parsed.
+    Callers must not modify the returned profiles.
+
+    Args:
+        path: Path to the defaults file (e.g., default_mappings.conf)
+        mtime_ns: Modification time of the file in nanoseconds
+
+    Returns:
+        Dict mapping profile name -> Profile (in file order)
+    """
+    return {p.name: p for p in load_default_profiles(path)}
 
 
 def create_initial_config(mac_address: str = None) -> Tuple[bool, str]:
@@ -1068,8 +1216,6 @@ def create_initial_config(mac_address: str = None) -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    from .config_loader import load_profiles_from_legacy_file
-
     config_dir = get_config_dir()
     profiles_dir = get_profiles_dir()
 
@@ -1082,12 +1228,14 @@ def create_initial_config(mac_address: str = None) -> Tuple[bool, str]:
 
     # Find default_mappings.conf
     default_config = Path(__file__).parent / 'default_mappings.conf'
-    if not default_config.exists():
+    try:
+        default_mtime = default_config.stat().st_mtime_ns
+    except FileNotFoundError:
         return False, f"Default config not found: {default_config}"
 
     try:
         # Load profiles from default config
-        profiles = load_profiles_from_legacy_file(str(default_config))
+        profiles = list(_load_default_profiles(str(default_config), default_mtime).values())
         if not profiles:
             return False, "No profiles found in default config"
 
@@ -1096,12 +1244,26 @@ def create_initial_config(mac_address: str = None) -> Tuple[bool, str]:
         profiles_dir.mkdir(parents=True, exist_ok=True)
 
         # Write each profile to individual file
+        # Each file's data is synced before its rename; the directory is
+        # fsynced once for the whole batch instead of after every profile
+        # The profiles are independent, so serialize and write them in parallel
         profile_count = 0
-        for profile in profiles:
-            filepath = get_profile_filepath(profile.name)
-            if save_profile_to_file(profile, filepath):
-                profile_count += 1
-                logger.info(f"Created profile: {profile.name}")
+        dir_fd = os.open(str(profiles_dir), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            def save(profile) -> bool:
+                return save_profile_to_file(profile, get_profile_filepath(profile.name), dir_fd=dir_fd)
+
+            with ThreadPoolExecutor(max_workers=min(8, len(profiles))) as executor:
+                results = list(executor.map(save, profiles))
+
+            for profile, saved in zip(profiles, results):
+                if saved:
+                    profile_count += 1
+                    logger.info(f"Created profile: {profile.name}")
+
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
 
         if profile_count == 0:
             return False, "Failed to create any profile files"
@@ -1130,8 +1292,6 @@ def ensure_tuxbox_gui_profile() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    from .config_loader import load_profiles_from_legacy_file
-
     profiles_dir = get_profiles_dir()
     gui_profile_path = profiles_dir / 'tuxbox_gui.profile'
 
@@ -1150,25 +1310,21 @@ def ensure_tuxbox_gui_profile() -> Tuple[bool, str]:
 
     # Find default_mappings.conf
     default_config = Path(__file__).parent / 'default_mappings.conf'
-    if not default_config.exists():
+    try:
+        default_mtime = default_config.stat().st_mtime_ns
+    except FileNotFoundError:
         return False, f"Default config not found: {default_config}"
 
     try:
-        # Load all profiles from default config
-        profiles = load_profiles_from_legacy_file(str(default_config))
-
-        # Find the TuxBox GUI profile
-        gui_profile = None
-        for profile in profiles:
-            if profile.name == 'TuxBox GUI':
-                gui_profile = profile
-                break
+        # Load all profiles from default config and find the TuxBox GUI profile
+        profiles_by_name = _load_default_profiles(str(default_config), default_mtime)
+        gui_profile = profiles_by_name.get('TuxBox GUI')
 
         if gui_profile is None:
             return False, "TuxBox GUI profile not found in default config"
 
         # Ensure profiles directory exists
-        profiles_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(profiles_dir)
 
         # Save the profile
         if save_profile_to_file(gui_profile, gui_profile_path):
@@ -1192,8 +1348,6 @@ def ensure_default_profile() -> Tuple[bool, str]:
     Returns:
         Tuple of (success, message)
     """
-    from .config_loader import load_profiles_from_legacy_file
-
     profiles_dir = get_profiles_dir()
     default_profile_path = profiles_dir / 'default.profile'
 
@@ -1203,25 +1357,21 @@ def ensure_default_profile() -> Tuple[bool, str]:
 
     # Find default_mappings.conf
     default_config = Path(__file__).parent / 'default_mappings.conf'
-    if not default_config.exists():
+    try:
+        default_mtime = default_config.stat().st_mtime_ns
+    except FileNotFoundError:
         return False, f"Default config not found: {default_config}"
 
     try:
-        # Load all profiles from default config
-        profiles = load_profiles_from_legacy_file(str(default_config))
-
-        # Find the default profile
-        default_profile = None
-        for profile in profiles:
-            if profile.name == 'default':
-                default_profile = profile
-                break
+        # Load all profiles from default config and find the default profile
+        profiles_by_name = _load_default_profiles(str(default_config), default_mtime)
+        default_profile = profiles_by_name.get('default')
 
         if default_profile is None:
             return False, "Default profile not found in default config"
 
         # Ensure profiles directory exists
-        profiles_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(profiles_dir)
 
         # Save the profile
         if save_profile_to_file(default_profile, default_profile_path):
@@ -10,11 +10,30 @@ import logging
 import subprocess
 import json
 import os
-from typing import Optional, Dict
-from dataclasses import dataclass
+import re
+import shutil
+import socket
+import struct
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# Detected compositor per session, keyed by (XDG_CURRENT_DESKTOP,
+# XDG_SESSION_TYPE, WAYLAND_DISPLAY). Detection spawns several probe
+# processes, so later WindowMonitor instances in the same session reuse it.
+_compositor_cache: Dict[tuple, str] = {}
+
+# Sway IPC (i3-ipc protocol): "i3-ipc" magic, payload length, message type
+SWAY_IPC_MAGIC = b'i3-ipc'
+SWAY_IPC_HEADER = struct.Struct('<6sII')
+SWAY_IPC_SUBSCRIBE = 2
+SWAY_IPC_GET_TREE = 4
+SWAY_IPC_EVENT_WINDOW = 0x80000003
+
+# JSON string inside gdbus tuple output: ('{"wm_class": "...", ...}',)
+_GDBUS_RE = re.compile(r"\('(.+)',\)", re.S)
+
 
 @dataclass
 class WindowInfo:
@@ -23,23 +42,49 @@ class WindowInfo:
     title: str = ""
     wm_class: str = ""
 
+    # Lowercased copies for Profile.matches, computed once per window
+    app_id_lc: str = field(init=False, repr=False, compare=False)
+    title_lc: str = field(init=False, repr=False, compare=False)
+    wm_class_lc: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.app_id_lc = (self.app_id or "").lower()
+        self.title_lc = (self.title or "").lower()
+        self.wm_class_lc = (self.wm_class or "").lower()
+
     def __repr__(self):
         return f"WindowInfo(app_id='{self.app_id}', title='{self.title}', class='{self.wm_class}')"
 
 
+# (app_id, title, wm_class) - what the backends return; cheap to compare
+# every poll, and only turned into a WindowInfo when the window changes
+WindowKey = Tuple[str, str, str]
+
+
 class WindowMonitor:
     """Monitor active window on Wayland compositors and X11"""
 
     def __init__(self):
         self.compositor = None
-        self.last_window = None
+        self.last_key: Optional[WindowKey] = None
+        self._unchanged_streak = 0  # Polls since the window last changed
+        self._sway_sock: Optional[socket.socket] = None  # Reused Sway IPC connection
         self._kdotool_path = self._find_kdotool()
         self._detect_compositor()
 
     def _find_kdotool(self) -> Optional[str]:
-        """Find kdotool in common locations"""
+        """Find kdotool in PATH or common locations
+
+        Only looks for an executable file - whether kdotool actually works
+        is checked by _test_kde when KDE detection runs.
+        """
+        # In PATH
+        path = shutil.which('kdotool')
+        if path:
+            return path
+
         # Check common installation paths
-        possible_paths = ['kdotool']  # In PATH
+        possible_paths = []
 
         # If running under sudo, check real user's home first
         sudo_user = os.environ.get('SUDO_USER')
@@ -56,16 +101,8 @@ class WindowMonitor:
         ])
 
         for path in possible_paths:
-            try:
-                result = subprocess.run(
-                    [path, '--version'],
-                    capture_output=True,
-                    timeout=1
-                )
-                if result.returncode == 0:
-                    return path
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
 
         return None
 
@@ -77,6 +114,13 @@ class WindowMonitor:
         session_type = os.environ.get('XDG_SESSION_TYPE', '').lower()
         wayland_display = os.environ.get('WAYLAND_DISPLAY', '')
 
+        cache_key = (session, session_type, wayland_display)
+        cached = _compositor_cache.get(cache_key)
+        if cached:
+            self.compositor = cached
+            logger.info(f"Detected window manager: {cached} (cached)")
+            return
+
         if not wayland_display and session_type != 'x11':
             logger.warning("WAYLAND_DISPLAY not set and not X11 - may not be running a supported session")
 
@@ -91,9 +135,16 @@ class WindowMonitor:
             ('x11', self._test_x11),
         ]
 
+        # Try the compositor named by XDG_CURRENT_DESKTOP first (e.g. "KDE",
+        # "ubuntu:GNOME") so the usual case needs a single probe
+        preferred = next((name for name in ('kde', 'gnome', 'hyprland', 'sway', 'niri') if name in session), None)
+        if preferred:
+            detectors.sort(key=lambda detector: detector[0] != preferred)
+
         for name, test_func in detectors:
             if test_func():
                 self.compositor = name
+                _compositor_cache[cache_key] = name
                 logger.info(f"Detected window manager: {name}")
                 return
 
@@ -137,15 +188,18 @@ class WindowMonitor:
             return False
 
     def _test_gnome(self) -> bool:
-        """Test if GNOME Shell is running"""
+        """Test if GNOME Shell is running (owns org.gnome.Shell on the session bus)"""
         try:
             result = subprocess.run(
-                ['gdbus', 'introspect', '--session', '--dest', 'org.gnome.Shell',
-                 '--object-path', '/org/gnome/Shell'],
+                ['gdbus', 'call', '--session', '--dest', 'org.freedesktop.DBus',
+                 '--object-path', '/org/freedesktop/DBus',
+                 '--method', 'org.freedesktop.DBus.NameHasOwner', 'org.gnome.Shell'],
                 capture_output=True,
+                text=True,
                 timeout=1
             )
-            return result.returncode == 0
+            # Output format: (true,)
+            return result.returncode == 0 and 'true' in result.stdout
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
@@ -184,273 +238,476 @@ class WindowMonitor:
 
     def get_active_window(self) -> Optional[WindowInfo]:
         """Get information about the currently active window"""
+        key = self._get_active_window_key()
+        return WindowInfo(*key) if key else None
+
+    def _get_active_window_key(self) -> Optional[WindowKey]:
+        """Get (app_id, title, wm_class) of the currently active window
 
+        Blocking - used by get_active_window() (e.g., from the GUI).
+        """
         if not self.compositor:
             return None
 
         try:
             if self.compositor == 'sway':
-                return self._get_sway_window()
-            elif self.compositor == 'hyprland':
-                return self._get_hyprland_window()
-            elif self.compositor == 'gnome':
-                return self._get_gnome_window()
-            elif self.compositor == 'kde':
-                return self._get_kde_window()
-            elif self.compositor == 'niri':
-                return self._get_niri_window()
-            elif self.compositor == 'x11':
-                return self._get_x11_window()
+                tree_json = self._sway_ipc(SWAY_IPC_GET_TREE)
+                if tree_json is not None:
+                    return self._parse_sway_window(tree_json)
+
+            query = self._window_query()
+            if not query:
+                return None
+
+            argv, timeout, parse = query
+            return parse(self._run(argv, timeout))
+        except Exception as e:
+            logger.error(f"Error getting active window: {e}")
+            return None
+
+    async def _get_active_window_key_async(self) -> Optional[WindowKey]:
+        """Async variant of _get_active_window_key for the monitor loop
+
+        Runs the query command with asyncio subprocesses so a slow or hung
+        compositor tool does not stall the event loop. On Sway the persistent
+        IPC socket is used from a worker thread instead, falling back to
+        swaymsg only when the socket is unavailable.
+        """
+        if not self.compositor:
+            return None
+
+        try:
+            if self.compositor == 'sway':
+                tree_json = await asyncio.to_thread(self._sway_ipc, SWAY_IPC_GET_TREE)
+                if tree_json is not None:
+                    return self._parse_sway_window(tree_json)
+
+            query = self._window_query()
+            if not query:
+                return None
+
+            argv, timeout, parse = query
+            return parse(await self._run_async(argv, timeout))
         except Exception as e:
             logger.error(f"Error getting active window: {e}")
             return None
 
+    def _window_query(self) -> Optional[Tuple[List[str], float, Callable[[Optional[str]], Optional[WindowKey]]]]:
+        """Command that reports the active window, its timeout and output parser"""
+        if self.compositor == 'sway':
+            return ['swaymsg', '-t', 'get_tree'], 1, self._parse_sway_window
+        elif self.compositor == 'hyprland':
+            return ['hyprctl', 'activewindow', '-j'], 1, self._parse_hyprland_window
+        elif self.compositor == 'gnome':
+            # Provided by the "Focused Window D-Bus" extension (works on modern GNOME)
+            return [
+                'gdbus', 'call', '--session',
+                '--dest', 'org.gnome.Shell',
+                '--object-path', '/org/gnome/shell/extensions/FocusedWindow',
+                '--method', 'org.gnome.shell.extensions.FocusedWindow.Get'
+            ], 2, self._parse_gnome_window
+        elif self.compositor == 'kde':
+            if not self._kdotool_path:
+                return None
+            # Get window class and title in one call - kdotool chains
+            # actions and prints one line per query
+            return [self._kdotool_path, 'getactivewindow', 'getwindowclassname', 'getwindowname'], 1, \
+                self._parse_tool_window
+        elif self.compositor == 'niri':
+            return ['niri', 'msg', '--json', 'focused-window'], 1, self._parse_niri_window
+        elif self.compositor == 'x11':
+            # xdotool chains commands the same way as kdotool
+            return ['xdotool', 'getactivewindow', 'getwindowclassname', 'getwindowname'], 1, \
+                self._parse_tool_window
+
         return None
 
-    def _get_sway_window(self) -> Optional[WindowInfo]:
-        """Get active window from Sway"""
+    def _run(self, argv: List[str], timeout: float = 1) -> Optional[str]:
+        """Run a query command, returning its stdout or None on failure"""
         try:
-            result = subprocess.run(
-                ['swaymsg', '-t', 'get_tree'],
-                capture_output=True,
-                text=True,
-                timeout=1
+            result = subprocess.run(argv, capture_output=True, text=True, timeout=timeout)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+
+        return result.stdout if result.returncode == 0 else None
+
+    async def _run_async(self, argv: List[str], timeout: float = 1) -> Optional[str]:
+        """Run a query command without blocking the event loop
+
+        Returns:
+            stdout of the command, or None if it is missing, fails or times out
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
             )
+        except FileNotFoundError:
+            return None
 
-            if result.returncode != 0:
-                return None
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+
+        return stdout.decode(errors='replace') if proc.returncode == 0 else None
+
+    def _sway_ipc(self, msg_type: int, payload: bytes = b'') -> Optional[bytes]:
+        """Send a message over the Sway IPC socket and return the reply payload
+
+        The connection to $SWAYSOCK is opened on first use and kept for later
+        polls. On any error it is dropped and reopened on the next call.
+
+        Args:
+            msg_type: i3-ipc message type (e.g., SWAY_IPC_GET_TREE)
+            payload: Message payload
+
+        Returns:
+            Reply payload bytes, or None if IPC is unavailable or failed
+        """
+        sock_path = os.environ.get('SWAYSOCK')
+        if not sock_path:
+            return None
+
+        try:
+            if self._sway_sock is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(1)
+                sock.connect(sock_path)
+                self._sway_sock = sock
+
+            self._sway_sock.sendall(SWAY_IPC_HEADER.pack(SWAY_IPC_MAGIC, len(payload), msg_type) + payload)
+
+            magic, length, _ = SWAY_IPC_HEADER.unpack(self._sway_recv(SWAY_IPC_HEADER.size))
+            if magic != SWAY_IPC_MAGIC:
+                raise ValueError("bad i3-ipc magic in reply")
+            return self._sway_recv(length)
+
+        except (OSError, ValueError, struct.error) as e:
+            logger.debug(f"Sway IPC error: {e}")
+            if self._sway_sock is not None:
+                self._sway_sock.close()
+                self._sway_sock = None
+            return None
 
-            tree = json.loads(result.stdout)
+    def _sway_recv(self, size: int) -> bytes:
+        """Read exactly size bytes from the Sway IPC socket"""
+        buf = bytearray()
+        while len(buf) < size:
+            chunk = self._sway_sock.recv(size - len(buf))
+            if not chunk:
+                raise ConnectionError("Sway IPC socket closed")
+            buf += chunk
+        return bytes(buf)
+
+    def _parse_sway_window(self, output: Optional[Union[str, bytes]]) -> Optional[WindowKey]:
+        """Parse the Sway tree (GET_TREE reply or swaymsg output)"""
+        if output is None:
+            return None
+
+        try:
+            tree = json.loads(output)
             focused = self._find_focused_node(tree)
 
             if focused:
-                return WindowInfo(
-                    app_id=focused.get('app_id', ''),
-                    title=focused.get('name', ''),
-                    wm_class=focused.get('window_properties', {}).get('class', '')
+                return (
+                    focused.get('app_id', ''),
+                    focused.get('name', ''),
+                    focused.get('window_properties', {}).get('class', '')
                 )
         except Exception as e:
             logger.debug(f"Sway window detection error: {e}")
 
         return None
 
-    def _find_focused_node(self, node):
-        """Recursively find the focused node in Sway tree"""
-        if node.get('focused'):
-            return node
+    def _find_focused_node(self, root):
+        """Find the focused node in Sway tree (iterative depth-first search)"""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if node.get('focused'):
+                return node
 
-        for child in node.get('nodes', []) + node.get('floating_nodes', []):
-            result = self._find_focused_node(child)
-            if result:
-                return result
+            # Push in reverse so children are visited in tree order
+            stack.extend(reversed(node.get('floating_nodes', ())))
+            stack.extend(reversed(node.get('nodes', ())))
 
         return None
 
-    def _get_hyprland_window(self) -> Optional[WindowInfo]:
-        """Get active window from Hyprland"""
-        try:
-            result = subprocess.run(
-                ['hyprctl', 'activewindow', '-j'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
-
-            if result.returncode != 0:
-                return None
+    def _parse_hyprland_window(self, output: Optional[str]) -> Optional[WindowKey]:
+        """Parse `hyprctl activewindow -j` output"""
+        if output is None:
+            return None
 
-            window = json.loads(result.stdout)
+        try:
+            window = json.loads(output)
 
-            return WindowInfo(
-                app_id=window.get('class', ''),
-                title=window.get('title', ''),
-                wm_class=window.get('class', '')
-            )
+            return (window.get('class', ''), window.get('title', ''), window.get('class', ''))
         except Exception as e:
             logger.debug(f"Hyprland window detection error: {e}")
 
         return None
 
-    def _get_niri_window(self) -> Optional[WindowInfo]:
-        """Get active window from Niri"""
-        try:
-            result = subprocess.run(
-                ['niri', 'msg', '--json', "focused-window"],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
-
-            if result.returncode != 0:
-                return None
+    def _parse_niri_window(self, output: Optional[str]) -> Optional[WindowKey]:
+        """Parse `niri msg --json focused-window` output"""
+        if output is None:
+            return None
 
-            window = json.loads(result.stdout)
+        try:
+            window = json.loads(output)
 
-            return WindowInfo(
-                app_id=window.get('app_id', ''),
-                title=window.get('title', ''),
-                wm_class=window.get('app_id', '')
-            )
+            return (window.get('app_id', ''), window.get('title', ''), window.get('app_id', ''))
         except Exception as e:
             logger.debug(f"Niri window detection error: {e}")
 
         return None
 
-    def _get_gnome_window(self) -> Optional[WindowInfo]:
-        """Get active window from GNOME Shell
+    def _parse_gnome_window(self, output: Optional[str]) -> Optional[WindowKey]:
+        """Parse the reply of the GNOME Shell "Focused Window D-Bus" extension
 
         Requires the "Focused Window D-Bus" extension:
         https://extensions.gnome.org/extension/5592/focused-window-d-bus/
         """
-        try:
-            # Try the "Focused Window D-Bus" extension first (works on modern GNOME)
-            result = subprocess.run([
-                'gdbus', 'call', '--session',
-                '--dest', 'org.gnome.Shell',
-                '--object-path', '/org/gnome/shell/extensions/FocusedWindow',
-                '--method', 'org.gnome.shell.extensions.FocusedWindow.Get'
-            ], capture_output=True, text=True, timeout=2)
-
-            if result.returncode == 0 and result.stdout:
-                # Parse the returned JSON from gdbus
-                # Output format: ('{"wm_class": "...", "title": "...", ...}',)
-                import re
-
-                # Extract JSON string from gdbus tuple output
-                json_match = re.search(r'\(\'(.+)\',\)', result.stdout)
-                if json_match:
-                    json_str = json_match.group(1)
-                    # Parse JSON
-                    try:
-                        data = json.loads(json_str)
-                        wm_class = data.get('wm_class', '')
-                        title = data.get('title', '')
-
-                        if wm_class or title:
-                            return WindowInfo(
-                                app_id=wm_class,
-                                title=title,
-                                wm_class=wm_class
-                            )
-                    except json.JSONDecodeError:
-                        logger.debug("Failed to parse JSON from Focused Window D-Bus")
-
-        except Exception as e:
-            logger.debug(f"GNOME Focused Window D-Bus extension error: {e}")
+        if output:
+            # Parse the returned JSON from gdbus
+            # Output format: ('{"wm_class": "...", "title": "...", ...}',)
+            json_match = _GDBUS_RE.search(output)
+            if json_match:
+                json_str = json_match.group(1)
+                # Parse JSON
+                try:
+                    data = json.loads(json_str)
+                    wm_class = data.get('wm_class', '')
+                    title = data.get('title', '')
+
+                    if wm_class or title:
+                        return (wm_class, title, wm_class)
+                except json.JSONDecodeError:
+                    logger.debug("Failed to parse JSON from Focused Window D-Bus")
 
         # Extension not installed - GNOME 40+ blocks Shell.Eval for security
         logger.warning("GNOME: Focused Window D-Bus extension not detected")
         logger.warning("Install from: https://extensions.gnome.org/extension/5592/focused-window-d-bus/")
         return None
 
-    def _get_kde_window(self) -> Optional[WindowInfo]:
-        """Get active window from KDE Plasma (KWin)
+    def _parse_tool_window(self, output: Optional[str]) -> Optional[WindowKey]:
+        """Parse chained `getwindowclassname getwindowname` output
 
-        Uses kdotool as a command-line tool (subprocess).
-        kdotool internally uses D-Bus to communicate with KWin.
-
-        Requires: cargo install kdotool
+        Shared by kdotool (KDE Plasma, requires: cargo install kdotool) and
+        xdotool (X11): the window class on the first line, title on the second.
         """
-        if not self._kdotool_path:
+        if output is None:
             return None
 
-        try:
-            # Get window class
-            class_result = subprocess.run(
-                [self._kdotool_path, 'getactivewindow', 'getwindowclassname'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
-
-            # Get window title
-            title_result = subprocess.run(
-                [self._kdotool_path, 'getactivewindow', 'getwindowname'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
+        lines = output.splitlines()
+        window_class = lines[0].strip() if lines else ''
+        window_title = lines[1].strip() if len(lines) > 1 else ''
 
-            if class_result.returncode == 0 or title_result.returncode == 0:
-                window_class = class_result.stdout.strip() if class_result.returncode == 0 else ''
-                window_title = title_result.stdout.strip() if title_result.returncode == 0 else ''
+        return (window_class, window_title, window_class)
 
-                return WindowInfo(
-                    app_id=window_class,
-                    title=window_title,
-                    wm_class=window_class
-                )
+    async def _notify_if_changed(self, key: Optional[WindowKey], callback) -> bool:
+        """Call callback with a WindowInfo if key differs from the last one seen
 
-        except Exception as e:
-            logger.debug(f"KDE window detection error: {e}")
+        Returns:
+            True if the window changed
+        """
+        if key == self.last_key:
+            return False
 
-        return None
+        if key:
+            window = WindowInfo(*key)
+            logger.debug(f"Window changed: {window}")
+            await callback(window)
+        self.last_key = key
+        return True
 
-    def _get_x11_window(self) -> Optional[WindowInfo]:
-        """Get active window on X11 using xdotool
+    async def _sway_event_loop(self, callback):
+        """Follow focus changes through a Sway IPC window event subscription
 
-        Requires: xdotool (available in most distro repositories)
+        Returns when $SWAYSOCK is not set; raises OSError or
+        asyncio.IncompleteReadError if the connection fails or drops.
         """
-        try:
-            # Get window class
-            class_result = subprocess.run(
-                ['xdotool', 'getactivewindow', 'getwindowclassname'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
+        sock_path = os.environ.get('SWAYSOCK')
+        if not sock_path:
+            return
 
-            # Get window title
-            title_result = subprocess.run(
-                ['xdotool', 'getactivewindow', 'getwindowname'],
-                capture_output=True,
-                text=True,
-                timeout=1
-            )
+        reader, writer = await asyncio.open_unix_connection(sock_path)
+        try:
+            payload = json.dumps(['window']).encode()
+            writer.write(SWAY_IPC_HEADER.pack(SWAY_IPC_MAGIC, len(payload), SWAY_IPC_SUBSCRIBE) + payload)
+            await writer.drain()
+
+            logger.info("Following Sway window events")
+
+            # Pick up the window focused before the subscription
+            await self._notify_if_changed(await self._get_active_window_key_async(), callback)
+
+            while True:
+                magic, length, msg_type = SWAY_IPC_HEADER.unpack(await reader.readexactly(SWAY_IPC_HEADER.size))
+                if magic != SWAY_IPC_MAGIC:
+                    raise ValueError("bad i3-ipc magic in event")
+                body = await reader.readexactly(length)
+
+                if msg_type == SWAY_IPC_SUBSCRIBE:
+                    if not json.loads(body).get('success'):
+                        raise ValueError("Sway rejected window event subscription")
+                    continue
+                if msg_type != SWAY_IPC_EVENT_WINDOW:
+                    continue
+
+                try:
+                    event = json.loads(body)
+                    container = event.get('container') or {}
+                    # Title changes matter too - profiles can match on window title
+                    if event.get('change') not in ('focus', 'title') or not container.get('focused'):
+                        continue
+
+                    key = (
+                        container.get('app_id') or '',
+                        container.get('name') or '',
+                        (container.get('window_properties') or {}).get('class', '')
+                    )
+                    await self._notify_if_changed(key, callback)
+                except Exception as e:
+                    logger.error(f"Error handling Sway window event: {e}")
+        finally:
+            writer.close()
+
+    def _hyprland_socket_path(self, name: str) -> Optional[str]:
+        """Locate a Hyprland IPC socket for the running instance
+
+        Hyprland 0.40+ keeps its sockets under $XDG_RUNTIME_DIR/hypr, older
+        versions under /tmp/hypr.
+        """
+        signature = os.environ.get('HYPRLAND_INSTANCE_SIGNATURE')
+        if not signature:
+            return None
 
-            if class_result.returncode == 0 or title_result.returncode == 0:
-                window_class = class_result.stdout.strip() if class_result.returncode == 0 else ''
-                window_title = title_result.stdout.strip() if title_result.returncode == 0 else ''
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR', '')
+        for base in (os.path.join(runtime_dir, 'hypr') if runtime_dir else None, '/tmp/hypr'):
+            if base:
+                path = os.path.join(base, signature, name)
+                if os.path.exists(path):
+                    return path
 
-                return WindowInfo(
-                    app_id=window_class,
-                    title=window_title,
-                    wm_class=window_class
-                )
+        return None
 
-        except Exception as e:
-            logger.debug(f"X11 window detection error: {e}")
+    async def _hyprland_event_loop(self, callback):
+        """Follow focus and title changes through Hyprland's event socket (.socket2.sock)
 
-        return None
+        Returns when the socket cannot be found; raises OSError if the
+        connection fails or drops.
+        """
+        sock_path = self._hyprland_socket_path('.socket2.sock')
+        if not sock_path:
+            return
 
-    async def monitor_window_changes(self, callback, interval: float = 0.2):
+        reader, writer = await asyncio.open_unix_connection(sock_path)
+        try:
+            logger.info("Following Hyprland window events")
+
+            # Pick up the window focused before connecting
+            await self._notify_if_changed(await self._get_active_window_key_async(), callback)
+
+            # activewindow only fires on focus changes, so title changes of the
+            # focused window (browser tab, editor buffer) are followed through
+            # windowtitlev2, or windowtitle plus a re-query on older Hyprland
+            active_address = None
+            window_class = ''
+            has_title_v2 = False
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    raise ConnectionError("Hyprland event socket closed")
+
+                event, _, data = line.decode(errors='replace').rstrip('\n').partition('>>')
+
+                try:
+                    if event == 'activewindow':
+                        # Format: activewindow>>CLASS,TITLE (title may contain commas)
+                        window_class, _, title = data.partition(',')
+                        if not window_class and not title:
+                            continue  # No window focused (e.g., empty workspace)
+                        key = (window_class, title, window_class)
+
+                    elif event == 'activewindowv2':
+                        # Format: activewindowv2>>ADDRESS (sent after activewindow)
+                        active_address = data
+                        continue
+
+                    elif event == 'windowtitlev2':
+                        # Format: windowtitlev2>>ADDRESS,TITLE
+                        has_title_v2 = True
+                        address, _, title = data.partition(',')
+                        if active_address is None:
+                            # Focused before connecting - its address is unknown
+                            key = await self._get_active_window_key_async()
+                        elif address == active_address:
+                            key = (window_class, title, window_class)
+                        else:
+                            continue
+
+                    elif event == 'windowtitle' and not has_title_v2:
+                        # Format: windowtitle>>ADDRESS - the title has to be queried
+                        if active_address is not None and data != active_address:
+                            continue
+                        key = await self._get_active_window_key_async()
+
+                    else:
+                        continue
+
+                    await self._notify_if_changed(key, callback)
+                except Exception as e:
+                    logger.error(f"Error handling Hyprland window event: {e}")
+        finally:
+            writer.close()
+
+    async def monitor_window_changes(self, callback, interval: float = 0.2,
+                                     max_interval: float = 1.0):
         """Monitor for window changes and call callback when window changes
 
+        Sway and Hyprland push focus changes over their IPC sockets, so no
+        polling is needed there. Other compositors, or Sway/Hyprland when the
+        event socket is unavailable, are polled: every interval seconds after
+        a change, backing off by doubling up to max_interval while the window
+        stays the same.
+
         Args:
             callback: Async function to call with WindowInfo when window changes
-            interval: Polling interval in seconds (default 200ms)
+            interval: Polling interval in seconds right after a change (default 200ms)
+            max_interval: Longest polling interval while idle (default 1s)
         """
         if not self.compositor:
             logger.warning("No compositor detected - window monitoring disabled")
             return
 
+        try:
+            if self.compositor == 'sway':
+                await self._sway_event_loop(callback)
+            elif self.compositor == 'hyprland':
+                await self._hyprland_event_loop(callback)
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            logger.warning(f"{self.compositor} window events unavailable ({e}) - falling back to polling")
+
         logger.info(f"Starting window monitor (compositor: {self.compositor}, interval: {interval}s)")
 
         while True:
             try:
-                current_window = self.get_active_window()
-
-                # Check if window changed
-                if current_window != self.last_window:
-                    if current_window:
-                        logger.debug(f"Window changed: {current_window}")
-                        await callback(current_window)
-                    self.last_window = current_window
-
-                await asyncio.sleep(interval)
+                if await self._notify_if_changed(await self._get_active_window_key_async(), callback):
+                    self._unchanged_streak = 0
+                else:
+                    self._unchanged_streak += 1
             except Exception as e:
                 logger.error(f"Error in window monitor: {e}")
-                await asyncio.sleep(interval)
+                # Back off on repeated failures too, rather than retrying
+                # (and logging) at the fastest rate forever
+                self._unchanged_streak += 1
+
+            await asyncio.sleep(min(max_interval, interval * 2 ** min(self._unchanged_streak, 4)))
 
 
 # Backward compatibility alias